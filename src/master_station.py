@@ -3,18 +3,21 @@ import json
 import os
 import time
 
-from utils.logger import Logger
+from utils.logger import get_logger
 from utils.nats import NatsClient
 
 NATS_ADDRESS = os.getenv("NATS_ADDRESS", "nats://localhost:4222")
 NATS_STREAMS = ["PLANETS", "MASTER"]
+GAME_STATE_FLUSH_DELAY = 0.05  # Seconds planet resource updates are coalesced
 
 
 class MasterStation:
     def __init__(self):
         self.resources = {"gold": 250, "food": 250, "metal": 250}
-        self.logger = Logger(__name__).get_logger()
+        self.logger = get_logger(__name__)
         self.game_state_publisher = None  # track it for reuse
+        self.game_state_update_publisher = None
+        self.game_state_flush = None  # Pending coalesced game state push
         self.game_reset_subscriber = None
         self.base_food_consumption_rate = 1
         self.game_start_time = time.time()
@@ -23,28 +26,67 @@ class MasterStation:
     async def resource_cb(self, msg):
         try:
             self.logger.debug("Received resource transmission")
-            data = json.loads(msg.data.decode())
-            for k, v in data.items():
-                new_value = self.resources[k] + int(v)
-                # Prevent resources from going negative
-                self.resources[k] = max(0, new_value)
+            data = json.loads(msg.data)
+            # Bulk grants arrive as a JSON array of resource objects
+            for grant in data if isinstance(data, list) else (data,):
+                for k, v in grant.items():
+                    new_value = self.resources[k] + int(v)
+                    # Prevent resources from going negative
+                    self.resources[k] = max(0, new_value)
+            self.schedule_game_state_publish()
             self.logger.debug(
-                f"Gold: {self.resources.get('gold')}, Food: {self.resources.get('food')}, Metal: {self.resources.get('metal')}"
+                "Gold: %s, Food: %s, Metal: %s",
+                self.resources.get("gold"),
+                self.resources.get("food"),
+                self.resources.get("metal"),
             )
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in message: {msg.data} — {e}")
         except Exception as e:
             self.logger.exception(f"Error handling resource message: {e}")
 
+    def get_game_state(self):
+        return {
+            "resources": self.resources,
+        }
+
     async def game_state_reply_cb(self, msg, publisher):
         try:
-            game_stats = {
-                "resources": self.resources,
-            }
-            await publisher.publish_reply_json(game_stats, msg)
+            await publisher.publish_reply_json(self.get_game_state(), msg)
         except Exception as e:
             self.logger.exception(f"Failed to handle game state request: {e}")
 
+    async def publish_game_state(self):
+        """Push the current game state to clients subscribed to updates"""
+        if self.game_state_update_publisher is None:
+            return
+        await self.game_state_update_publisher.publish_json(self.get_game_state())
+
+    def schedule_game_state_publish(self):
+        """Push the game state shortly, folding a burst of updates into one message"""
+        if self.game_state_flush is None:
+            self.game_state_flush = asyncio.create_task(self._flush_game_state())
+
+    async def _flush_game_state(self):
+        await asyncio.sleep(GAME_STATE_FLUSH_DELAY)
+        # Clear before publishing so updates arriving mid-publish schedule another
+        self.game_state_flush = None
+        try:
+            await self.publish_game_state()
+        except Exception as e:
+            self.logger.exception(f"Failed to publish game state update: {e}")
+
+    async def stop_game_state_flush(self):
+        """Cancel a game state push that is still waiting to be sent"""
+        flush, self.game_state_flush = self.game_state_flush, None
+        if flush is None:
+            return
+        flush.cancel()
+        try:
+            await flush
+        except asyncio.CancelledError:
+            pass
+
     async def create_master_subs(self):
         self.master_resource_sub = NatsClient(NATS_ADDRESS, "MASTER.resources")
         await self.master_resource_sub.connect()
@@ -62,6 +104,11 @@ class MasterStation:
 
         await self.game_state_publisher.subscribe(callback_wrapper)
 
+        self.game_state_update_publisher = NatsClient(
+            NATS_ADDRESS, "game.state.updates"
+        )
+        await self.game_state_update_publisher.connect()
+
     async def consume_food(self):
         """Consume food for survival mechanics with progressive scaling"""
         # Calculate current consumption rate (increases every 30 seconds)
@@ -73,6 +120,7 @@ class MasterStation:
             self.resources["food"] = max(
                 0, self.resources["food"] - current_consumption
             )
+            await self.publish_game_state()
             self.logger.info(
                 f"Food consumed: {current_consumption}, Remaining: {self.resources['food']}"
             )
@@ -96,6 +144,7 @@ class MasterStation:
         """Reset the game state for a new game"""
         self.resources = {"gold": 250, "food": 250, "metal": 250}
         self.game_start_time = time.time()
+        await self.publish_game_state()
         self.logger.info("Game state reset - starting with 250 of each resource")
 
     async def game_reset_cb(self, msg):
@@ -120,7 +169,10 @@ async def main():
     await master_station.create_game_reset_sub()
     await master_station.start_food_consumption_timer()
 
-    await asyncio.Event().wait()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await master_station.stop_game_state_flush()
 
 
 if __name__ == "__main__":
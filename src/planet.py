@@ -5,7 +5,7 @@ import time
 from enum import Enum
 from typing import Dict, Optional
 
-from utils.logger import Logger
+from utils.logger import get_logger
 from utils.nats import NatsClient
 
 
@@ -30,11 +30,20 @@ class Planet:
             0
         ]
         self.available_resources = self._generate_resources(self.size)
+        # Bumped whenever available_resources changes so viewers can skip copies
+        self.resources_version = 0
+        # Running sum of available_resources, kept in step with every change
+        self.total_resources = sum(self.available_resources.values())
         self.resource_collection_speed = {"food": 1, "gold": 1, "metal": 1}
         self.upgrade_levels = {"food": 0, "gold": 0, "metal": 0}
+        # Collection per second for each resource, refreshed when upgrades apply
+        self.effective_rates = {
+            resource_type: self._effective_rate(resource_type)
+            for resource_type in self.upgrade_levels
+        }
 
         self.nats_address = nats_address
-        self.logger = Logger(f"Planet-{self.name}").get_logger()
+        self.logger = get_logger(f"Planet-{self.name}")
         self.resource_publisher: Optional[NatsClient] = None
         self.upgrade_subscriber: Optional[NatsClient] = None
 
@@ -95,7 +104,7 @@ class Planet:
 
                     if any(collected_resources.values()):
                         await self._send_resources_to_master(collected_resources)
-                        self.logger.debug(f"Sent resources: {collected_resources}")
+                        self.logger.debug("Sent resources: %s", collected_resources)
 
                     # Check if resources are depleted after collection
                     if self._check_resource_depletion():
@@ -114,32 +123,33 @@ class Planet:
         """Collect resources based on collection speed and available resources"""
         collected = {"food": 0, "gold": 0, "metal": 0}
 
-        for resource_type in ["food", "gold", "metal"]:
-            if self.available_resources.get(resource_type, 0) > 0:
-                # Calculate collection amount based on speed, upgrades, and time
-                base_collection = self.resource_collection_speed.get(resource_type, 1)
-                # Balanced upgrade multiplier: 1x, 1.75x, 2.5x, 3.25x, 4x per level
-                # Provides meaningful upgrades but hunger will eventually outscale
-                upgrade_level = self.upgrade_levels.get(resource_type, 0)
-                upgrade_multiplier = 1 + (upgrade_level * 0.75)
-                collection_amount = int(
-                    base_collection * upgrade_multiplier * time_diff
-                )
-
-                # Don't collect more than available
-                actual_collection = min(
-                    collection_amount, self.available_resources[resource_type]
-                )
+        available_resources = self.available_resources
+        for resource_type, rate in self.effective_rates.items():
+            available = available_resources.get(resource_type, 0)
+            if available > 0:
+                # Calculate collection amount based on speed, upgrades, and time,
+                # without collecting more than is available
+                actual_collection = min(int(rate * time_diff), available)
 
                 collected[resource_type] = actual_collection
-                self.available_resources[resource_type] -= actual_collection
+                if actual_collection:
+                    available_resources[resource_type] = available - actual_collection
+                    self.total_resources -= actual_collection
+                    self.resources_version += 1
 
         return collected
 
+    def _effective_rate(self, resource_type: str) -> float:
+        """Collection speed for a resource with its upgrade multiplier applied"""
+        base_collection = self.resource_collection_speed.get(resource_type, 1)
+        # Balanced upgrade multiplier: 1x, 1.75x, 2.5x, 3.25x, 4x per level
+        # Provides meaningful upgrades but hunger will eventually outscale
+        upgrade_level = self.upgrade_levels.get(resource_type, 0)
+        return base_collection * (1 + (upgrade_level * 0.75))
+
     def _check_resource_depletion(self) -> bool:
         """Check if all resources are depleted"""
-        total_resources = sum(self.available_resources.values())
-        return total_resources <= 0
+        return self.total_resources <= 0
 
     async def _handle_resource_depletion(self):
         """Handle planet shutdown when resources are depleted"""
@@ -176,7 +186,7 @@ class Planet:
     async def _handle_upgrade_command(self, msg):
         """Handle upgrade commands from the master station"""
         try:
-            data = json.loads(msg.data.decode())
+            data = json.loads(msg.data)
             resource_type = data.get("resource_type")
 
             if resource_type in ["food", "gold", "metal"]:
@@ -199,6 +209,7 @@ class Planet:
         """Apply an upgrade to resource production"""
         if resource_type in self.upgrade_levels:
             self.upgrade_levels[resource_type] += 1
+            self.effective_rates[resource_type] = self._effective_rate(resource_type)
             self.logger.info(
                 f"Upgraded {resource_type} to level {self.upgrade_levels[resource_type]}"
             )
@@ -16,7 +16,7 @@ from utils.docker import (
     cleanup_all_planet_containers,
     cleanup_non_home_planet_containers,
 )
-from utils.logger import Logger
+from utils.logger import get_logger
 from utils.nats import NatsClient
 
 CONFIG = AppConfig().get_config()
@@ -295,7 +295,7 @@ class DockernautsApp(App):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.logger = Logger(__name__).get_logger()
+        self.logger = get_logger(__name__)
 
     async def on_mount(self) -> None:
         self.nats_client = NatsClient(NATS_ADDRESS, subject="game.state")
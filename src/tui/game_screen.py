@@ -1,7 +1,11 @@
+import asyncio
+import functools
 import json
-import random
+import re
 import time
+from collections import OrderedDict, namedtuple
 
+from rich.style import Style
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -17,10 +21,11 @@ from tui.planet_status import PlanetStatusWindow
 from tui.planet_upgrade_panel import PlanetUpgradePanel, UpgradeRequested
 from utils.config import AppConfig
 from utils.docker import start_planet_container
-from utils.logger import Logger
+from utils.logger import get_logger
+from utils.nats import encode_json
 
 CONFIG = AppConfig().get_config()
-logger = Logger(__name__).get_logger()
+logger = get_logger(__name__)
 
 PLANET_TYPES = {
     "desert": {"color": "yellow", "name": "Desert World"},
@@ -32,26 +37,222 @@ PLANET_TYPES = {
     "rocky": {"color": "white", "name": "Rocky World"},
     "crystal": {"color": "magenta", "name": "Crystal World"},
 }
+PLANET_TYPE_KEYS = list(PLANET_TYPES.keys())
+
+PLANET_SECTOR_SIZE = 100
+STAR_COLOR = "#4a9eff"
+STAR_DENSITY = 0.03
+STAR_CHARS = ("✦", ".", "·", " ")
+STAR_TILE_SIZE = 512  # Must be a power of two
+MAX_CACHED_SECTORS = 256  # Generated sectors kept before least recently used eviction
+MAX_CACHED_FRAMES = 8  # Rendered space view frames kept for reuse
+
+# Styles drawn by the space view, parsed once. The color grids store indexes
+# into this list, with the star color at index 0.
+_PALETTE = [Style.parse(STAR_COLOR)]
+_PALETTE_INDEX = {STAR_COLOR: 0}
+
+# Runs of the same palette index within a row of the color buffer
+_COLOR_RUN = re.compile(rb"(.)\1*", re.DOTALL)
+
+
+def _palette_index(color):
+    """Get the palette index for a color, parsing its style on first use"""
+    index = _PALETTE_INDEX.get(color)
+    if index is None:
+        index = _PALETTE_INDEX[color] = len(_PALETTE)
+        _PALETTE.append(Style.parse(color))
+    return index
+
+# Templates with their dimensions and opaque (dx, dy, text) runs, computed once
+# at import so planets can be blitted a row segment at a time. Templates that do
+# not fit in a sector are dropped here rather than checked per sector.
+PlanetTemplate = namedtuple("PlanetTemplate", "art width height runs")
+
+PLANET_TEMPLATE_RECORDS = [
+    record
+    for record in (
+        PlanetTemplate(
+            art=template,
+            width=max(len(line) for line in template),
+            height=len(template),
+            runs=tuple(
+                (match.start(), dy, match.group())
+                for dy, line in enumerate(template)
+                for match in re.finditer(r"[^ ]+", line)
+            ),
+        )
+        for template in PLANET_TEMPLATES
+    )
+    if record.width <= PLANET_SECTOR_SIZE and record.height <= PLANET_SECTOR_SIZE
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _selection_border(planet_w, planet_h):
+    """Selection border cells for a planet size as (dx, dy, char, is_corner).
+
+    Offsets are relative to the planet's top-left corner, with the corner
+    markers last so they are drawn over the border lines.
+    """
+    left, right = -2, planet_w + 1
+    top, bottom = -2, planet_h + 1
+    cells = []
+    # Top and bottom borders
+    for dx in range(left + 1, right):
+        cells.append((dx, top, "═", False))
+        cells.append((dx, bottom, "═", False))
+    # Left and right borders
+    for dy in range(top + 1, bottom):
+        cells.append((left, dy, "║", False))
+        cells.append((right, dy, "║", False))
+    # Corner markers for extra visibility
+    for dx, dy in ((left, top), (right, top), (left, bottom), (right, bottom)):
+        cells.append((dx, dy, "▣", True))
+    return tuple(cells)
+
+
+@functools.lru_cache(maxsize=4)
+def _star_tile(density, star_chars):
+    """Build the tileable star texture as one string per row.
+
+    Each cell is hashed once here; rendering then only slices these rows at the
+    world coordinates modulo the tile size. Rows are stored twice over so any
+    slice up to a full tile wide can be taken without wrapping.
+    """
+    size = STAR_TILE_SIZE
+    star_threshold = int(density * 0x10000)
+    rows = []
+    for y in range(size):
+        y_term = y * 689287
+        cells = []
+        for x in range(size):
+            h = (x * 92837111 + y_term) & 0xFFFFFFFF
+            h = ((h ^ (h >> 16)) * 0x45D9F3B) & 0xFFFFFFFF
+            h ^= h >> 16
+            cells.append(star_chars[h >> 30] if h & 0xFFFF < star_threshold else " ")
+        row = "".join(cells)
+        rows.append(row + row)
+    return rows
+
+
+def _splitmix64(seed):
+    """Mix a 64-bit seed into a well distributed 64-bit hash (SplitMix64)"""
+    z = (seed + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B5) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_SECTORS)
+def _gen_sector(sx, sy):
+    """Generate the planet for a sector, or None if the sector is empty.
+
+    Planets are fully deterministic from the sector coordinates, so sectors that
+    scroll out of the cache are simply regenerated when they come back into view.
+    The returned dict is shared between callers and must not be mutated. Sectors
+    are always PLANET_SECTOR_SIZE wide, the same grid SpaceView looks them up in.
+    """
+    sector_w = PLANET_SECTOR_SIZE
+    # Every choice is taken from its own bits of one 64-bit hash:
+    # 0-15 presence, 16-23 template, 24-31 type, 32-47 x and 48-63 y
+    h = _splitmix64(((sx & 0xFFFFFFFF) << 32) | (sy & 0xFFFFFFFF))
+    # Reduced planet density for better performance and realism
+    if h & 0xFFFF >= int(0.4 * 0x10000):
+        return None
+
+    template = PLANET_TEMPLATE_RECORDS[(h >> 16 & 0xFF) % len(PLANET_TEMPLATE_RECORDS)]
+    planet_w = template.width
+    planet_h = template.height
+
+    planet_type = PLANET_TYPE_KEYS[(h >> 24 & 0xFF) % len(PLANET_TYPE_KEYS)]
+    planet_info = PLANET_TYPES[planet_type]
+
+    planet_x = sx * sector_w + (h >> 32 & 0xFFFF) % (sector_w - planet_w + 1)
+    planet_y = sy * sector_w + (h >> 48) % (sector_w - planet_h + 1)
+
+    return {
+        "art": template.art,
+        "runs": template.runs,
+        "type": planet_type,
+        "color": planet_info["color"],
+        "color_index": _palette_index(planet_info["color"]),
+        "name": planet_info["name"],
+        "position": (planet_x, planet_y),
+        "sector": (sx, sy),
+        "key": (sx, sy),
+        "width": planet_w,
+        "height": planet_h,
+    }
+
+
+def _resource_delta_payload(gold=0, food=0, metal=0):
+    """Encode a MASTER.resources change without going through json.dumps"""
+    return b'{"gold": %d, "food": %d, "metal": %d}' % (gold, food, metal)
 
 
 class SpaceView(Static):
+    # Map colors to valid bright variants for the selected planet
+    _COLOR_MAPPING = {
+        "yellow": "bright_yellow",
+        "blue": "bright_blue",
+        "green": "bright_green",
+        "cyan": "bright_cyan",
+        "red": "bright_red",
+        "purple": "magenta",  # purple -> magenta for terminal compatibility
+        "white": "bright_white",
+        "magenta": "bright_magenta",
+    }
+    _BOLD_BRIGHT = {color: f"bold {bright}" for color, bright in _COLOR_MAPPING.items()}
+    _BORDER_COLOR = "bright_cyan"
+    _CORNER_COLOR = "bright_magenta"
+
     def __init__(self):
         super().__init__()
         self.offset_x = 0
         self.offset_y = 0
-        self.density = 0.03
-        self.star_chars = ["✦", ".", "·", " "]
-        self.planets = {}  # Visual planet data
-        self.planet_instances = {}  # Actual Planet instances
-        self.planet_templates = PLANET_TEMPLATES
-        self.planet_sector_size = 100
+        self.density = STAR_DENSITY
+        self.star_chars = STAR_CHARS
+        self.planets = {}  # Visual planet data for the current viewport only
+        self.planet_instances = {}  # Actual Planet instances, created on first use
         self.needs_render = True
         self.status_callback = None
         self.planet_click_callback = None
+        self.selection_lost_callback = None
+        self._last_sector = None
+        self._last_sector_range = None
+
+        # Frames are drawn on demand after the screen refresh that follows a
+        # change, rather than from a polling interval
+        self._render_scheduled = False
+        self._rendering_paused = False
+
+        # Pan steps received since the last frame, applied once per tick
+        self._pending_dx = 0
+        self._pending_dy = 0
+
+        # Star rows of the last frame, keyed by (offset_x, offset_y, width, height)
+        self._star_rows = []
+        self._star_key = None
+
+        # Everything drawn is determined by the viewport and the selection, so
+        # an identical key means the previous frame can be kept as is
+        self._frame_key = None
+        # Recently built frames by the same key, so panning back and forth
+        # reuses them instead of rebuilding the Text
+        self._frame_cache = OrderedDict()
+
+        # Row-major palette indexes and the per-row character grid, reused
+        # across frames, and the rows drawn on last frame
+        self._color_buf = bytearray()
+        self._color_blank = b""
+        self._char_grid = []
+        self._drawn_rows = set()
 
         # Planet selection for keyboard interaction
         self.selected_planet = None
         self.nearby_planets = []
+        self._nearby_index = {}  # Planet key -> position in nearby_planets
 
     def set_status_callback(self, callback):
         """Set a callback function to update status"""
@@ -61,16 +262,54 @@ class SpaceView(Static):
         """Set a callback function for when planets are clicked"""
         self.planet_click_callback = callback
 
+    def set_selection_lost_callback(self, callback):
+        """Set a callback function for when panning leaves no planet selected"""
+        self.selection_lost_callback = callback
+
     def on_mount(self):
-        # Reduce refresh rate from 30 FPS to 15 FPS for better performance
-        self.set_interval(1 / 15, self.refresh_display)
+        self.schedule_render()
+
+    def on_resize(self):
+        # The cached star rows and color buffers are rebuilt for the new size
+        self.schedule_render()
+
+    def schedule_render(self):
+        """Mark the view dirty and draw it once after the next screen refresh"""
+        self.needs_render = True
+        if self._render_scheduled or self._rendering_paused or not self.is_mounted:
+            return
+        self._render_scheduled = True
+        self.call_after_refresh(self._run_scheduled_render)
+
+    def _run_scheduled_render(self):
+        self._render_scheduled = False
+        self.refresh_display()
+
+    def pause_rendering(self):
+        """Stop drawing while the view is covered by another screen"""
+        self._rendering_paused = True
+
+    def resume_rendering(self):
+        """Start drawing again, redrawing in case the size changed"""
+        self._rendering_paused = False
+        self.schedule_render()
 
     # Mouse clicking disabled due to terminal compatibility issues
     # Use keyboard controls instead: Tab to cycle, E to select nearest, Enter to interact
 
     def get_planet_at_position(self, world_x, world_y):
-        """Check if the given world coordinates are on a planet with improved collision detection"""
-        for planet_key, planet in self.planets.items():
+        """Check if the given world coordinates are on a planet with improved collision detection.
+
+        Returns the shared planet dict from the sector cache, which callers must
+        not mutate.
+        """
+        # Hit padding never exceeds a quarter of a sector, so only the sectors
+        # within that reach of the point can contain a match
+        reach = PLANET_SECTOR_SIZE // 4
+        nearby = self.iter_visible_planets(
+            world_x - reach, world_y - reach, 2 * reach, 2 * reach
+        )
+        for _, planet in nearby:
             px, py = planet["position"]
             planet_w = planet["width"]
             planet_h = planet["height"]
@@ -83,69 +322,65 @@ class SpaceView(Static):
                 px - padding <= world_x < px + planet_w + padding
                 and py - padding <= world_y < py + planet_h + padding
             ):
-
-                return {
-                    "position": (px, py),
-                    "world_coords": (world_x, world_y),
-                    "art": planet["art"],
-                    "type": planet.get("type", "rocky"),
-                    "color": planet.get("color", "white"),
-                    "sector": planet["sector"],
-                    "name": planet.get("name", "Unknown Planet"),
-                    "key": planet_key,
-                }
+                return planet
         return None
 
     def get_nearby_planets(self, visible_only=True):
         """Get planets that are visible on screen or near screen center"""
-        width, height = self.size.width, self.size.height
+        width, height = self.size
         if width <= 0 or height <= 0:
             return []
 
+        self._apply_pending_pan()
+
         center_x = self.offset_x + width // 2
         center_y = self.offset_y + height // 2
 
+        self._populate_visible_planets(self.offset_x, self.offset_y, width, height)
+
+        # self.planets only holds the sectors overlapping the viewport
+        screen_left = self.offset_x
+        screen_right = self.offset_x + width
+        screen_top = self.offset_y
+        screen_bottom = self.offset_y + height
+
         nearby = []
         for planet_key, planet in self.planets.items():
             px, py = planet["position"]
             planet_w, planet_h = planet["width"], planet["height"]
 
+            # Squared distance from screen center is enough for sorting
+            distance_sq = (px - center_x) ** 2 + (py - center_y) ** 2
+
             if visible_only:
                 # Check if planet is at least partially visible on screen
                 # Planet is visible if any part overlaps with screen bounds
-                planet_left = px
-                planet_right = px + planet_w
-                planet_top = py
-                planet_bottom = py + planet_h
-
-                screen_left = self.offset_x
-                screen_right = self.offset_x + width
-                screen_top = self.offset_y
-                screen_bottom = self.offset_y + height
-
-                # Check for overlap (planet is visible)
                 if (
-                    planet_right > screen_left
-                    and planet_left < screen_right
-                    and planet_bottom > screen_top
-                    and planet_top < screen_bottom
+                    px + planet_w > screen_left
+                    and px < screen_right
+                    and py + planet_h > screen_top
+                    and py < screen_bottom
                 ):
-
-                    # Calculate distance from screen center for sorting
-                    distance = ((px - center_x) ** 2 + (py - center_y) ** 2) ** 0.5
                     nearby.append(
-                        {"key": planet_key, "distance": distance, "planet": planet}
+                        {
+                            "key": planet_key,
+                            "distance_sq": distance_sq,
+                            "planet": planet,
+                        }
                     )
             else:
                 # Original behavior - distance-based selection
-                distance = ((px - center_x) ** 2 + (py - center_y) ** 2) ** 0.5
-                if distance <= 200:  # max_distance fallback
+                if distance_sq <= 200**2:  # max_distance fallback
                     nearby.append(
-                        {"key": planet_key, "distance": distance, "planet": planet}
+                        {
+                            "key": planet_key,
+                            "distance_sq": distance_sq,
+                            "planet": planet,
+                        }
                     )
 
         # Sort by distance (closest first)
-        nearby.sort(key=lambda p: p["distance"])
+        nearby.sort(key=lambda p: p["distance_sq"])
         return nearby
 
     def select_nearest_planet(self):
@@ -153,13 +388,16 @@ class SpaceView(Static):
         nearby = self.get_nearby_planets(visible_only=True)
         if nearby:
             self.selected_planet = nearby[0]["key"]
-            self.needs_render = True
+            self.schedule_render()
             return self.planets[self.selected_planet]
         return None
 
     def cycle_planet_selection(self, direction=1):
         """Cycle through visible planets only (direction: 1=next, -1=previous)"""
         self.nearby_planets = self.get_nearby_planets(visible_only=True)
+        self._nearby_index = {
+            planet_data["key"]: i for i, planet_data in enumerate(self.nearby_planets)
+        }
         if not self.nearby_planets:
             self.selected_planet = None
             return None
@@ -169,11 +407,7 @@ class SpaceView(Static):
             self.selected_planet = self.nearby_planets[0]["key"]
         else:
             # Find current selection in visible planets and move to next/previous
-            current_index = -1
-            for i, planet_data in enumerate(self.nearby_planets):
-                if planet_data["key"] == self.selected_planet:
-                    current_index = i
-                    break
+            current_index = self._nearby_index.get(self.selected_planet, -1)
 
             if current_index >= 0:
                 # Current selection is visible, cycle to next/previous
@@ -183,7 +417,7 @@ class SpaceView(Static):
                 # Current selection not visible anymore, select first visible planet
                 self.selected_planet = self.nearby_planets[0]["key"]
 
-        self.needs_render = True
+        self.schedule_render()
         return self.planets[self.selected_planet]
 
     def interact_with_selected_planet(self):
@@ -203,202 +437,323 @@ class SpaceView(Static):
                 return True
         return False
 
+    def selected_planet_info(self):
+        """Get the info dict shown in the planet panels for the selected planet"""
+        if self.selected_planet is None:
+            return None
+        planet = _gen_sector(*self.selected_planet)
+        if planet is None:
+            return None
+        return {
+            "position": planet["position"],
+            "type": planet["type"],
+            "color": planet["color"],
+            "sector": planet["sector"],
+            "name": planet["name"],
+            "key": self.selected_planet,
+        }
+
+    def get_planet_instance(self, planet_key):
+        """Get the Planet instance for a planet key, creating it on first use"""
+        planet_instance = self.planet_instances.get(planet_key)
+        if planet_instance is None:
+            planet = _gen_sector(*planet_key)
+            if planet is None:
+                return None
+            sx, sy = planet_key
+            planet_x, planet_y = planet["position"]
+            planet_instance = Planet(
+                name=planet["name"],
+                uuid=f"planet_{sx}_{sy}",
+                x=planet_x,
+                y=planet_y,
+            )
+            self.planet_instances[planet_key] = planet_instance
+        return planet_instance
+
     def pan(self, dx: int, dy: int):
-        self.offset_x += dx * 2
-        self.offset_y += dy
-        self.needs_render = True
+        # Key repeat can deliver several pans between screen refreshes, so
+        # only record them here and apply them together in the next frame
+        self._pending_dx += dx
+        self._pending_dy += dy
+        self.schedule_render()
+
+    def _apply_pending_pan(self):
+        """Move the viewport by the pan steps received since the last frame"""
+        if not (self._pending_dx or self._pending_dy):
+            return
+
+        self.offset_x += self._pending_dx * 2
+        self.offset_y += self._pending_dy
+        self._pending_dx = 0
+        self._pending_dy = 0
 
         # Clear selection if currently selected planet is no longer visible
-        if self.selected_planet:
-            visible_planets = self.get_nearby_planets(visible_only=True)
-            visible_keys = [p["key"] for p in visible_planets]
-            if self.selected_planet not in visible_keys:
-                self.selected_planet = None
+        if self.selected_planet and not self.is_planet_visible(
+            _gen_sector(*self.selected_planet)
+        ):
+            self.selected_planet = None
+
+        if self.selected_planet is None and self.selection_lost_callback:
+            self.selection_lost_callback()
 
         if self.status_callback:
             self.update_sector_position()
 
+    def is_planet_visible(self, planet):
+        """Check if any part of a planet overlaps the screen"""
+        width, height = self.size
+        if planet is None or width <= 0 or height <= 0:
+            return False
+        px, py = planet["position"]
+        return (
+            px + planet["width"] > self.offset_x
+            and px < self.offset_x + width
+            and py + planet["height"] > self.offset_y
+            and py < self.offset_y + height
+        )
+
     def update_sector_position(self):
         """Calculate current sector based on screen center"""
-        width, height = self.size.width, self.size.height
+        width, height = self.size
         if width <= 0 or height <= 0:
             return
 
         center_x = self.offset_x + width // 2
         center_y = self.offset_y + height // 2
-        sector_x = center_x // self.planet_sector_size
-        sector_y = center_y // self.planet_sector_size * -1
+        sector_x = center_x // PLANET_SECTOR_SIZE
+        sector_y = center_y // PLANET_SECTOR_SIZE * -1
+
+        # Most pans stay within a sector, skip the status update when they do
+        if (sector_x, sector_y) == self._last_sector:
+            return
+        self._last_sector = (sector_x, sector_y)
 
         self.status_callback(sector_x, sector_y)
 
     def refresh_display(self):
-        if not self.needs_render:
+        if not self.needs_render or self._rendering_paused:
+            return
+
+        # Leave needs_render set so the frame is drawn once the view is shown
+        if not self.display or self.region.width == 0:
             return
 
-        width, height = self.size.width, self.size.height
+        width, height = self.size
         if width <= 0 or height <= 0:
             return
 
+        self._apply_pending_pan()
+
         ox, oy = self.offset_x, self.offset_y
 
+        frame_key = (ox, oy, width, height, self.selected_planet)
+        if frame_key == self._frame_key:
+            self.needs_render = False
+            return
+        self._frame_key = frame_key
+
+        text = self._frame_cache.get(frame_key)
+        if text is not None:
+            self._frame_cache.move_to_end(frame_key)
+            self.update(text)
+            self.needs_render = False
+            return
+
         # Create a Rich Text object for colored output
         text = Text()
 
-        # Cache of what's drawn so planets can overwrite it
-        char_grid = [[" "] * width for _ in range(height)]
-        color_grid = [["#4a9eff"] * width for _ in range(height)]  # Default star color
-
-        # Draw stars with simple optimization - reuse Random instance
-        star_rng = random.Random()
-        for row in range(height):
-            y = oy + row
-            for col in range(width):
-                x = ox + col
-                seed = (x * 92837111 + y * 689287) & 0xFFFFFFFF
-                star_rng.seed(seed)
-                char_grid[row][col] = (
-                    star_rng.choice(self.star_chars)
-                    if star_rng.random() < self.density
-                    else " "
-                )
+        # Stars only depend on the viewport, so reuse last frame's rows
+        self._update_star_rows(ox, oy, width, height)
+
+        # Rows stay plain star strings until something is drawn on them. The
+        # palette indexes live in one flat buffer that persists between frames
+        # and is cleared with a single slice assignment; the row grid and the
+        # drawn row set are refilled in place rather than reallocated.
+        if len(self._color_buf) != width * height:
+            self._color_buf = bytearray(width * height)
+            self._color_blank = bytes(width * height)
+        elif self._drawn_rows:
+            self._color_buf[:] = self._color_blank
+        color_buf = self._color_buf
+        drawn_rows = self._drawn_rows
+        drawn_rows.clear()
+        char_grid = self._char_grid
+        char_grid[:] = self._star_rows
+
+        def chars_for(row):
+            chars = char_grid[row]
+            if row not in drawn_rows:
+                drawn_rows.add(row)
+                chars = char_grid[row] = list(chars)
+            return chars
 
         # Generate and draw planets
         self._populate_visible_planets(ox, oy, width, height)
 
         for planet_key, planet in self.planets.items():
             px, py = planet["position"]
-            planet_color = planet.get("color", "white")
+            is_selected = planet_key == self.selected_planet
+
+            # Skip planets in the visible sectors that miss the viewport, keeping
+            # room for the selection border drawn two cells outside the art
+            margin = 2 if is_selected else 0
+            if (
+                px + planet["width"] + margin <= ox
+                or py + planet["height"] + margin <= oy
+                or px - margin >= ox + width
+                or py - margin >= oy + height
+            ):
+                continue
 
             # Highlight selected planet
-            is_selected = planet_key == self.selected_planet
+            planet_color_index = planet["color_index"]
             if is_selected:
-                # Map colors to valid bright variants
-                color_mapping = {
-                    "yellow": "bright_yellow",
-                    "blue": "bright_blue",
-                    "green": "bright_green",
-                    "cyan": "bright_cyan",
-                    "red": "bright_red",
-                    "purple": "magenta",  # purple -> magenta for terminal compatibility
-                    "white": "bright_white",
-                    "magenta": "bright_magenta",
-                }
-                mapped_color = color_mapping.get(planet_color, planet_color)
-                planet_color = f"bold {mapped_color}"
+                planet_color = planet["color"]
+                planet_color_index = _palette_index(
+                    self._BOLD_BRIGHT.get(planet_color, f"bold {planet_color}")
+                )
 
-            for dy, line in enumerate(planet["art"]):
-                for dx, ch in enumerate(line):
-                    gx, gy = px + dx, py + dy
-                    sx, sy = gx - ox, gy - oy
-                    if 0 <= sx < width and 0 <= sy < height and ch != " ":
-                        char_grid[sy][sx] = ch
-                        color_grid[sy][sx] = planet_color
+            # Clip each opaque run to the viewport and copy it in one slice
+            for dx, dy, run in planet["runs"]:
+                sy = py + dy - oy
+                if not 0 <= sy < height:
+                    continue
+                sx = px + dx - ox
+                start = max(0, -sx)
+                end = min(len(run), width - sx)
+                if start < end:
+                    chars_for(sy)[sx + start : sx + end] = run[start:end]
+                    cell = sy * width + sx
+                    color_buf[cell + start : cell + end] = bytes(
+                        [planet_color_index]
+                    ) * (end - start)
 
             # Add selection indicator around planet
             if is_selected:
-                planet_w, planet_h = planet["width"], planet["height"]
-                # Draw bright selection border with corner markers
-                # Top and bottom borders
-                for border_x in range(px - 2, px + planet_w + 2):
-                    for border_y in [py - 2, py + planet_h + 1]:
-                        sx, sy = border_x - ox, border_y - oy
-                        if 0 <= sx < width and 0 <= sy < height:
-                            if char_grid[sy][sx] == " ":
-                                char_grid[sy][sx] = "═"
-                                color_grid[sy][sx] = "bright_cyan"
-
-                # Left and right borders
-                for border_y in range(py - 2, py + planet_h + 2):
-                    for border_x in [px - 2, px + planet_w + 1]:
-                        sx, sy = border_x - ox, border_y - oy
-                        if 0 <= sx < width and 0 <= sy < height:
-                            if char_grid[sy][sx] == " ":
-                                char_grid[sy][sx] = "║"
-                                color_grid[sy][sx] = "bright_cyan"
-
-                # Corner markers for extra visibility
-                corners = [
-                    (px - 2, py - 2),
-                    (px + planet_w + 1, py - 2),
-                    (px - 2, py + planet_h + 1),
-                    (px + planet_w + 1, py + planet_h + 1),
-                ]
-                for corner_x, corner_y in corners:
-                    sx, sy = corner_x - ox, corner_y - oy
+                border_color_index = _palette_index(self._BORDER_COLOR)
+                corner_color_index = _palette_index(self._CORNER_COLOR)
+                # Draw bright selection border with corner markers. Borders only
+                # fill empty space, corners are always drawn.
+                border = _selection_border(planet["width"], planet["height"])
+                for dx, dy, char, is_corner in border:
+                    sx, sy = px + dx - ox, py + dy - oy
                     if 0 <= sx < width and 0 <= sy < height:
-                        char_grid[sy][sx] = "▣"
-                        color_grid[sy][sx] = "bright_magenta"
-
-        # Build colored text output
+                        if is_corner:
+                            chars_for(sy)[sx] = char
+                            color_buf[sy * width + sx] = corner_color_index
+                        elif char_grid[sy][sx] == " ":
+                            chars_for(sy)[sx] = char
+                            color_buf[sy * width + sx] = border_color_index
+
+        # Build colored text output, one append per run of same-colored cells.
+        # Consecutive rows of plain star field are batched into a single append.
+        star_rows = []
         for row in range(height):
-            for col in range(width):
-                char = char_grid[row][col]
-                color = color_grid[row][col]
-                text.append(char, style=color)
+            chars = char_grid[row]
+            if row not in drawn_rows:
+                star_rows.append(chars)
+                continue
+            if star_rows:
+                text.append("\n".join(star_rows) + "\n", style=_PALETTE[0])
+                star_rows = []
+
+            row_start = row * width
+            for run in _COLOR_RUN.finditer(color_buf, row_start, row_start + width):
+                start, end = run.start() - row_start, run.end() - row_start
+                text.append("".join(chars[start:end]), style=_PALETTE[run[0][0]])
             if row < height - 1:  # Don't add newline after last row
                 text.append("\n")
+        if star_rows:
+            text.append("\n".join(star_rows), style=_PALETTE[0])
+
+        self._frame_cache[frame_key] = text
+        if len(self._frame_cache) > MAX_CACHED_FRAMES:
+            self._frame_cache.popitem(last=False)
 
         self.update(text)
         self.needs_render = False
 
-    def _populate_visible_planets(self, ox, oy, width, height):
-        sector_w = self.planet_sector_size
-        min_sector_x = (ox) // sector_w
-        max_sector_x = (ox + width) // sector_w
-        min_sector_y = (oy) // sector_w
-        max_sector_y = (oy + height) // sector_w
-
-        for sx in range(min_sector_x, max_sector_x + 1):
-            for sy in range(min_sector_y, max_sector_y + 1):
-                sector_key = f"sector_{sx}_{sy}"
-                if sector_key not in self.planets:
-                    rng = random.Random((sx * 99991 + sy * 31337) & 0xFFFFFFFF)
-                    # Reduced planet density for better performance and realism
-                    if rng.random() < 0.4:
-                        template = rng.choice(self.planet_templates)
-                        planet_w = max(len(line) for line in template)
-                        planet_h = len(template)
-
-                        if planet_w > sector_w or planet_h > sector_w:
-                            logger.debug(
-                                f"Skipping planet too large ({planet_w}x{planet_h}) for sector size {sector_w}"
-                            )
-                            continue
-
-                        planet_type = rng.choice(list(PLANET_TYPES.keys()))
-                        planet_info = PLANET_TYPES[planet_type]
-
-                        planet_x = sx * sector_w + rng.randint(0, sector_w - planet_w)
-                        planet_y = sy * sector_w + rng.randint(0, sector_w - planet_h)
-
-                        # Create actual Planet instance
-                        planet_instance = Planet(
-                            name=planet_info["name"],
-                            uuid=f"planet_{sx}_{sy}",
-                            x=planet_x,
-                            y=planet_y,
-                        )
+    def _star_strip(self, x_start, x_end, y):
+        """Star characters for world columns [x_start, x_end) of world row y"""
+        # Stars come from a precomputed tiled texture rather than hashing every
+        # cell each time a strip is exposed
+        tile = _star_tile(self.density, self.star_chars)
+        row = tile[y & (STAR_TILE_SIZE - 1)]
+        start = x_start & (STAR_TILE_SIZE - 1)
+        length = x_end - x_start
+        if length > STAR_TILE_SIZE:
+            row = row * (length // STAR_TILE_SIZE + 1)
+        return row[start : start + length]
+
+    def _update_star_rows(self, ox, oy, width, height):
+        """Bring the cached star rows up to date with the viewport.
+
+        After a small pan only the newly exposed strip is generated; the rest of
+        the previous frame's rows are shifted into place.
+        """
+        key = (ox, oy, width, height)
+        if key == self._star_key:
+            return
 
-                        # Store both visual data and Planet instance
-                        self.planets[sector_key] = {
-                            "art": template,
-                            "type": planet_type,
-                            "color": planet_info["color"],
-                            "name": planet_info["name"],
-                            "position": (planet_x, planet_y),
-                            "sector": (sx, sy),
-                            "width": planet_w,
-                            "height": planet_h,
-                        }
-                        self.planet_instances[sector_key] = planet_instance
+        previous_key = self._star_key
+        previous_rows = self._star_rows
+        self._star_key = key
+
+        if previous_key is None or previous_key[2:] != (width, height):
+            self._star_rows = [
+                self._star_strip(ox, ox + width, oy + row) for row in range(height)
+            ]
+            return
+
+        dx = ox - previous_key[0]
+        dy = oy - previous_key[1]
+        rows = []
+        for row in range(height):
+            y = oy + row
+            source = row + dy
+            if not 0 <= source < height or abs(dx) >= width:
+                rows.append(self._star_strip(ox, ox + width, y))
+                continue
+
+            line = previous_rows[source]
+            if dx > 0:
+                line = line[dx:] + self._star_strip(ox + width - dx, ox + width, y)
+            elif dx < 0:
+                line = self._star_strip(ox, ox - dx, y) + line[:dx]
+            rows.append(line)
+        self._star_rows = rows
+
+    def iter_visible_planets(self, ox, oy, width, height):
+        """Yield (key, planet) for every planet in the sectors overlapping a region"""
+        sector_w = PLANET_SECTOR_SIZE
+        for sx in range(ox // sector_w, (ox + width) // sector_w + 1):
+            for sy in range(oy // sector_w, (oy + height) // sector_w + 1):
+                planet = _gen_sector(sx, sy)
+                if planet is not None:
+                    yield (sx, sy), planet
+
+    def _populate_visible_planets(self, ox, oy, width, height):
+        # The planet set only changes when the viewport covers a different
+        # range of sectors, which most frames don't
+        sector_w = PLANET_SECTOR_SIZE
+        sector_range = (
+            ox // sector_w,
+            (ox + width) // sector_w,
+            oy // sector_w,
+            (oy + height) // sector_w,
+        )
+        if sector_range == self._last_sector_range:
+            return
+        self.planets = dict(self.iter_visible_planets(ox, oy, width, height))
+        self._last_sector_range = sector_range
 
 
 class StatusBar(Horizontal):
     food = reactive(0)
     gold = reactive(0)
     metal = reactive(0)
-    sector_x = reactive(0)
-    sector_y = reactive(0)
+    sector = reactive((0, 0))
 
     def __init__(self):
         super().__init__()
@@ -417,8 +772,7 @@ class StatusBar(Horizontal):
             self.sector_display,
             self.controls_display,
         ]:
-            display.styles.height = 1
-            display.styles.max_height = 1
+            display.add_class("single-line")
 
     def compose(self) -> ComposeResult:
         yield self.food_display
@@ -431,8 +785,7 @@ class StatusBar(Horizontal):
         self.watch_food(self.food)
         self.watch_gold(self.gold)
         self.watch_metal(self.metal)
-        self.watch_sector_x(self.sector_x)
-        self.watch_sector_y(self.sector_y)
+        self.watch_sector(self.sector)
 
     def watch_food(self, value):
         self.food_display.update(f"Food: {value}")
@@ -443,11 +796,9 @@ class StatusBar(Horizontal):
     def watch_metal(self, value):
         self.metal_display.update(f"Metal: {value}")
 
-    def watch_sector_x(self, value):
-        self.sector_display.update(f"Sector: ({value},{self.sector_y})")
-
-    def watch_sector_y(self, value):
-        self.sector_display.update(f"Sector: ({self.sector_x},{value})")
+    def watch_sector(self, value):
+        sector_x, sector_y = value
+        self.sector_display.update(f"Sector: ({sector_x},{sector_y})")
 
 
 class SpaceScreen(Screen):
@@ -472,8 +823,10 @@ class SpaceScreen(Screen):
         self.nats_client = nats_client
         self.latest_game_state = {}
         self.debug_mode = CONFIG.get("debug_mode", False)
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self.state_subscription = None
         self.status_timer = None
+        self._game_over_triggered = False
 
     def compose(self):
         status_bar = StatusBar()
@@ -488,7 +841,7 @@ class SpaceScreen(Screen):
         yield PlanetUpgradePanel()
         yield PlanetClaimPanel()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         space_view = self.query_one(SpaceView)
         space_view.styles.width = "100%"
         space_view.styles.height = "100%"
@@ -500,9 +853,31 @@ class SpaceScreen(Screen):
 
         space_view.set_status_callback(self.update_sector_from_space_view)
         space_view.set_planet_click_callback(self.on_planet_clicked)
-        self.status_timer = self.set_interval(1, self.update_status)
+        space_view.set_selection_lost_callback(self.on_selection_lost)
         space_view.update_sector_position()
 
+        # The master station pushes state on every change; request it once so
+        # the status bar is filled in before the first update arrives. The
+        # request runs as a worker so a slow broker doesn't hold up the screen.
+        try:
+            self.state_subscription = await self.nats_client.nc.subscribe(
+                "game.state.updates", cb=self.on_game_state_update
+            )
+        except Exception as e:
+            logger.error(f"Failed to subscribe to game state updates: {e}")
+            # Without pushed updates, fall back to polling the master station
+            self.status_timer = self.set_interval(1, self.update_status)
+        self.run_worker(self.update_status(), group="game-state")
+
+    def on_screen_suspend(self) -> None:
+        self.query_one(SpaceView).pause_rendering()
+
+    def on_screen_resume(self) -> None:
+        self.query_one(SpaceView).resume_rendering()
+
+    async def on_unmount(self) -> None:
+        await self.stop_game_state_updates()
+
     def debug_notify(self, message, title=None, timeout=2):
         """Only show notification if debug mode is enabled"""
         if self.debug_mode:
@@ -515,7 +890,9 @@ class SpaceScreen(Screen):
         planet_type = planet_info.get("type", "Unknown")
 
         # Get planet instance if it exists
-        planet_instance = self.planet_instances.get(self.selected_planet)
+        planet_instance = self.query_one(SpaceView).get_planet_instance(
+            planet_info["key"]
+        )
         
         # Show planet status window with detailed information
         self.planet_status.show_planet_info(planet_info, planet_instance)
@@ -528,23 +905,55 @@ class SpaceScreen(Screen):
 
     def update_sector_from_space_view(self, sector_x, sector_y):
         """Called by SpaceView when sector changes"""
-        self.status.sector_x = sector_x
-        self.status.sector_y = sector_y
+        self.status.sector = (sector_x, sector_y)
 
     async def request_game_state(self):
         try:
             response = await self.nats_client.nc.request("game.state", b"", timeout=1)
-            data = json.loads(response.data.decode())
+            data = json.loads(response.data)
             self.latest_game_state = data.get("resources", {})
         except Exception as e:
             logger.error(f"Failed to request game state: {e}")
 
+    async def on_game_state_update(self, msg):
+        # Updates can still be in flight after game over unsubscribes
+        if self.state_subscription is None:
+            return
+        try:
+            data = json.loads(msg.data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid game state update: {msg.data} — {e}")
+            return
+        self.latest_game_state = data.get("resources", {})
+        self.apply_game_state()
+
+    async def stop_game_state_updates(self):
+        subscription, self.state_subscription = self.state_subscription, None
+        if subscription is None:
+            return
+        try:
+            await subscription.unsubscribe()
+        except Exception as e:
+            logger.error(f"Failed to unsubscribe from game state updates: {e}")
+
     async def update_status(self):
         await self.request_game_state()
+        self.apply_game_state()
+
+    def apply_game_state(self):
         resources = self.latest_game_state
-        self.status.food = resources.get("food", 0)
-        self.status.gold = resources.get("gold", 0)
-        self.status.metal = resources.get("metal", 0)
+        food = resources.get("food", 0)
+        gold = resources.get("gold", 0)
+        metal = resources.get("metal", 0)
+
+        # Most updates only change one resource, so skip the reactive writes
+        # for the ones that are unchanged
+        if self.status.food != food:
+            self.status.food = food
+        if self.status.gold != gold:
+            self.status.gold = gold
+        if self.status.metal != metal:
+            self.status.metal = metal
         
         # Check if food has reached zero - trigger game over
         if self.status.food <= 0:
@@ -553,13 +962,22 @@ class SpaceScreen(Screen):
     def _trigger_game_over(self):
         """Trigger game over screen with current stats"""
         from tui.game_over_screen import GameOverScreen
-        
-        # Stop the status update timer to prevent further updates
-        if self.status_timer:
+
+        # The initial request, polling and pushed updates can all see food hit
+        # zero, so only the first one ends the game
+        if self._game_over_triggered:
+            return
+        self._game_over_triggered = True
+        if self.status_timer is not None:
             self.status_timer.stop()
         
+        # Unsubscribe from state updates to prevent further updates
+        subscription, self.state_subscription = self.state_subscription, None
+        if subscription is not None:
+            self.run_worker(subscription.unsubscribe())
+        
         # Calculate game time
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         minutes = int(elapsed // 60)
         seconds = int(elapsed % 60)
         game_time = f"{minutes:02d}:{seconds:02d}"
@@ -599,82 +1017,34 @@ class SpaceScreen(Screen):
             case "right":
                 view.pan(1, 0)
 
-        # Hide status window if currently selected planet is no longer visible
-        if view.selected_planet is None:
-            self.planet_status.hide_status()
-            self.upgrade_panel.hide_panel()
-            self.claim_panel.hide_panel()
+    def on_selection_lost(self) -> None:
+        """Hide the planet panels once panning leaves no planet selected"""
+        self.planet_status.hide_status()
+        self.upgrade_panel.hide_panel()
+        self.claim_panel.hide_panel()
 
     def action_cycle_planets(self) -> None:
         """Select closest planet first, then cycle through visible planets"""
-        view = self.query_one(SpaceView)
-
-        # If no planet is selected, select the closest one
-        if view.selected_planet is None:
-            planet = view.select_nearest_planet()
-        else:
-            # If a planet is already selected, cycle to the next one
-            planet = view.cycle_planet_selection(1)
-
-        if planet:
-            # Create planet_info dict for status window
-            planet_info = {
-                "position": planet["position"],
-                "type": planet["type"],
-                "color": planet["color"],
-                "sector": planet["sector"],
-                "name": planet["name"],
-                "key": view.selected_planet,
-            }
-            # Show info panel and appropriate interaction panel based on claimed status
-            planet_instance = view.planet_instances.get(view.selected_planet)
-            self.planet_status.show_planet_info(planet_info, planet_instance)
-
-            if planet_instance and planet_instance.claimed:
-                self.upgrade_panel.show_panel(
-                    planet_info, planet_instance, preserve_focus=True
-                )
-                self.claim_panel.hide_panel()
-                panel_type = "upgrades"
-            else:
-                self.claim_panel.show_panel(planet_info, planet_instance)
-                self.upgrade_panel.hide_panel()
-                panel_type = "claim"
-
-            self.debug_notify(
-                f"◉ {planet['name']} ({planet['type']}) - Press E to toggle info/{panel_type}",
-                title="Planet Selected",
-                timeout=3,
-            )
-        else:
-            self.planet_status.hide_status()
-            self.debug_notify(
-                "No planets nearby - Use arrow keys to explore", timeout=2
-            )
+        self._cycle_planets(1)
 
     def action_cycle_planets_reverse(self) -> None:
         """Cycle to previous planet"""
+        self._cycle_planets(-1)
+
+    def _cycle_planets(self, direction: int) -> None:
         view = self.query_one(SpaceView)
 
         # If no planet is selected, select the closest one
         if view.selected_planet is None:
             planet = view.select_nearest_planet()
         else:
-            # If a planet is already selected, cycle to the previous one
-            planet = view.cycle_planet_selection(-1)
+            # If a planet is already selected, cycle in the given direction
+            planet = view.cycle_planet_selection(direction)
 
         if planet:
-            # Create planet_info dict for status window
-            planet_info = {
-                "position": planet["position"],
-                "type": planet["type"],
-                "color": planet["color"],
-                "sector": planet["sector"],
-                "name": planet["name"],
-                "key": view.selected_planet,
-            }
+            planet_info = view.selected_planet_info()
             # Show info panel and appropriate interaction panel based on claimed status
-            planet_instance = view.planet_instances.get(view.selected_planet)
+            planet_instance = view.get_planet_instance(view.selected_planet)
             self.planet_status.show_planet_info(planet_info, planet_instance)
 
             if planet_instance and planet_instance.claimed:
@@ -708,7 +1078,7 @@ class SpaceScreen(Screen):
             return
 
         # Get planet instance to check claimed status
-        planet_instance = view.planet_instances.get(view.selected_planet)
+        planet_instance = view.get_planet_instance(view.selected_planet)
 
         # Check if panels are currently visible
         panels_visible = self.planet_status.visible and (
@@ -723,16 +1093,8 @@ class SpaceScreen(Screen):
             self.debug_notify("Panels hidden - Tab to select planets", timeout=1)
         else:
             # Show appropriate panel based on planet claimed status
-            planet = view.planets.get(view.selected_planet)
-            if planet and planet_instance:
-                planet_info = {
-                    "position": planet["position"],
-                    "type": planet["type"],
-                    "color": planet["color"],
-                    "sector": planet["sector"],
-                    "name": planet["name"],
-                    "key": view.selected_planet,
-                }
+            planet_info = view.selected_planet_info()
+            if planet_info and planet_instance:
 
                 # Force all panels to hide first
                 self.planet_status.hide_status()
@@ -820,29 +1182,22 @@ class SpaceScreen(Screen):
                 return
             
             # Deduct metal from player resources via NATS JetStream
-            deduct_message = {
-                "gold": 0,
-                "food": 0,
-                "metal": -cost,  # Negative value to subtract
-            }
-            js = self.nats_client.nc.jetstream()
-            await js.publish(
-                "MASTER.resources", json.dumps(deduct_message).encode()
-            )
+            deduct_message = _resource_delta_payload(metal=-cost)
+            js = self.nats_client.jetstream()
+            await js.publish("MASTER.resources", deduct_message)
 
-            # Send upgrade command to the planet's Docker container via NATS
+            # Send upgrade command to the planet's Docker container via NATS, only
+            # once the deduction above has been acknowledged
             if planet_data and hasattr(planet_data, 'uuid'):
                 upgrade_command = {
                     "resource_type": resource_type,
                     "cost": cost,
                     "timestamp": time.time()
                 }
-                
                 await js.publish(
-                    f"PLANETS.{planet_data.uuid}.upgrades",
-                    json.dumps(upgrade_command).encode()
+                    f"PLANETS.{planet_data.uuid}.upgrades", encode_json(upgrade_command)
                 )
-                
+
                 # Apply upgrade locally (the container will also apply it)
                 if hasattr(planet_data, '_apply_upgrade'):
                     planet_data._apply_upgrade(resource_type)
@@ -885,54 +1240,64 @@ class SpaceScreen(Screen):
         if self.latest_game_state.get("gold", 0) >= cost:
             # Attempt to claim the planet
             if planet_data and planet_data.claim_planet(cost):
-                # Deduct gold from player resources via NATS JetStream
+                # Deduct gold from player resources via NATS JetStream. The
+                # container is only started once the payment is acknowledged.
                 try:
-                    deduct_message = {
-                        "gold": -cost,
-                        "food": 0,
-                        "metal": 0,
-                    }  # Negative value to subtract
-                    js = self.nats_client.nc.jetstream()
-                    await js.publish(
-                        "MASTER.resources", json.dumps(deduct_message).encode()
+                    deduct_message = _resource_delta_payload(gold=-cost)
+                    js = self.nats_client.jetstream()
+                    await js.publish("MASTER.resources", deduct_message)
+                except Exception as e:
+                    logger.error(f"Failed to deduct gold via NATS: {e}")
+                    # Unpaid, so the planet goes back to unclaimed and the claim
+                    # panel stays up for another try
+                    planet_data.claimed = False
+                    self.notify(
+                        f"Failed to claim {planet_name}: could not update resources",
+                        title="Claim Failed",
+                        timeout=3,
                     )
+                    return
 
-                    # Start Docker container for the claimed planet
-                    try:
-                        nats_address = getattr(self.nats_client, 'url', 'nats://localhost:4222')
-                        container = start_planet_container(planet_name, planet_data.uuid, nats_address)
-                        if container:
-                            self.notify(
-                                f"Successfully claimed {planet_name} for {cost} gold! Container started.",
-                                title="Planet Claimed",
-                                timeout=3,
-                            )
-                        else:
-                            self.notify(
-                                f"Claimed {planet_name} for {cost} gold but failed to start container",
-                                title="Planet Claimed - Warning",
-                                timeout=3,
-                            )
-                    except Exception as docker_error:
-                        logger.error(f"Failed to start Docker container for planet {planet_name}: {docker_error}")
+                # Start Docker container for the claimed planet in a worker
+                # thread so the event loop keeps running while it boots
+                try:
+                    nats_address = getattr(self.nats_client, 'url', 'nats://localhost:4222')
+                    container = await asyncio.to_thread(
+                        start_planet_container, planet_name, planet_data.uuid, nats_address
+                    )
+                    if container:
+                        self.notify(
+                            f"Successfully claimed {planet_name} for {cost} gold! Container started.",
+                            title="Planet Claimed",
+                            timeout=3,
+                        )
+                    else:
                         self.notify(
-                            f"Claimed {planet_name} for {cost} gold but Docker container failed to start",
+                            f"Claimed {planet_name} for {cost} gold but failed to start container",
                             title="Planet Claimed - Warning",
                             timeout=3,
                         )
-                    
-                    # Hide claim panel and show status only
-                    self.claim_panel.hide_panel()
-                    # Refresh the panel display to show upgrade panel
-                    self.action_toggle_info_panel()
-                    self.action_toggle_info_panel()
-                except Exception as e:
-                    logger.error(f"Failed to deduct gold via NATS: {e}")
+                except Exception as docker_error:
+                    logger.error(f"Failed to start Docker container for planet {planet_name}: {docker_error}")
                     self.notify(
-                        f"Claimed {planet_name} but failed to update resources",
-                        title="Warning",
+                        f"Claimed {planet_name} for {cost} gold but Docker container failed to start",
+                        title="Planet Claimed - Warning",
                         timeout=3,
                     )
+
+                # Swap the claim panel for the upgrade panel, unless the
+                # selection moved on while the container was starting
+                self.claim_panel.hide_panel()
+                view = self.query_one(SpaceView)
+                if (
+                    view.selected_planet is not None
+                    and view.get_planet_instance(view.selected_planet) is planet_data
+                ):
+                    planet_info = view.selected_planet_info()
+                    self.planet_status.show_planet_info(planet_info, planet_data)
+                    self.upgrade_panel.show_panel(
+                        planet_info, planet_data, preserve_focus=False
+                    )
             else:
                 self.notify(
                     f"Failed to claim {planet_name}",
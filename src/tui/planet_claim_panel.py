@@ -1,8 +1,22 @@
+import functools
+import math
+
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.reactive import reactive
 from textual.widgets import Static, Button
 
+# Claim cost multipliers used when no Planet object is available
+_SIZE_MULTIPLIERS = {"small": 1.0, "medium": 1.5, "large": 2.0}
+
+
+@functools.lru_cache(maxsize=1024)
+def _fallback_claim_cost(distance_bucket, size):
+    """Estimate a claim cost from the distance in 100 unit steps and planet size"""
+    base_cost = 100
+    distance_cost = distance_bucket * 50
+    return int((base_cost + distance_cost) * _SIZE_MULTIPLIERS[size])
+
 
 class ClaimButton(Button):
     """Custom button for claiming planets with cost info"""
@@ -57,13 +71,9 @@ class PlanetClaimPanel(Vertical):
         self.divider2.add_class("claim-divider")
         
         # Style components
-        for widget in [self.title_display, self.divider1, self.divider2, self.instructions]:
-            widget.styles.height = 1
-            widget.styles.max_height = 1
-        
-        for widget in [self.planet_info, self.distance_info, self.cost_info]:
-            widget.styles.height = 1
-            widget.styles.max_height = 1
+        for widget in [self.title_display, self.divider1, self.divider2, self.instructions,
+                       self.planet_info, self.distance_info, self.cost_info]:
+            widget.add_class("single-line")
     
     def compose(self) -> ComposeResult:
         yield self.title_display
@@ -92,22 +102,24 @@ class PlanetClaimPanel(Vertical):
         # Initially hidden
         self.hide_panel()
     
+    def _update_planet_info(self):
+        """Show the planet name and size line"""
+        self.planet_info.update(
+            f"Planet: {self.planet_name} ({self.planet_size.upper()})"
+        )
+
     def watch_planet_name(self, value):
-        if hasattr(self, 'planet_info'):
-            self.planet_info.update(f"Planet: {value} ({self.planet_size.upper()})")
+        self._update_planet_info()
     
     def watch_claim_cost(self, value):
-        if hasattr(self, 'claim_button'):
-            self.claim_button.label = f"Claim Planet ({value}g)"
-            self.claim_button.cost = value
+        self.claim_button.label = f"Claim Planet ({value}g)"
+        self.claim_button.cost = value
     
     def watch_distance(self, value):
-        if hasattr(self, 'distance_info'):
-            self.distance_info.update(f"Distance from Origin: {value:.1f} units")
+        self.distance_info.update(f"Distance from Origin: {value:.1f} units")
     
     def watch_planet_size(self, value):
-        if hasattr(self, 'planet_info'):
-            self.planet_info.update(f"Planet: {self.planet_name} ({value.upper()})")
+        self._update_planet_info()
     
     def show_panel(self, planet_info, planet_data=None):
         """Show the claim panel for the selected planet"""
@@ -116,8 +128,7 @@ class PlanetClaimPanel(Vertical):
         
         # Calculate distance and cost
         x, y = planet_info.get("position", (0, 0))
-        import math
-        self.distance = math.sqrt(x ** 2 + y ** 2)
+        self.distance = math.hypot(x, y)
         
         # Get planet data to determine size and cost
         if planet_data and hasattr(planet_data, 'size'):
@@ -126,10 +137,9 @@ class PlanetClaimPanel(Vertical):
         else:
             # Fallback calculation if planet_data not available
             self.planet_size = "medium"  # Default assumption
-            base_cost = 100
-            distance_cost = int(self.distance / 100) * 50
-            size_multipliers = {"small": 1.0, "medium": 1.5, "large": 2.0}
-            self.claim_cost = int((base_cost + distance_cost) * size_multipliers[self.planet_size])
+            self.claim_cost = _fallback_claim_cost(
+                int(self.distance // 100), self.planet_size
+            )
         
         # Update cost display (simple)
         self.cost_info.update(f"Claim Cost: {self.claim_cost} gold")
@@ -140,6 +150,9 @@ class PlanetClaimPanel(Vertical):
     
     def hide_panel(self):
         """Hide the claim panel"""
+        # Already hidden and cleared, so there is nothing to reset
+        if not self.visible:
+            return
         self.visible = False
         self.is_panel_visible = False
         self.styles.display = "none"
@@ -170,6 +183,8 @@ class PlanetClaimPanel(Vertical):
 
 class ClaimRequested:
     """Custom message for when a planet claim is requested"""
+
+    __slots__ = ("claim_info",)
     
     def __init__(self, claim_info):
         self.claim_info = claim_info
\ No newline at end of file
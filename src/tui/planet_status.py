@@ -1,3 +1,8 @@
+import functools
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.reactive import reactive
@@ -5,6 +10,26 @@ from textual.timer import Timer
 from textual.widgets import Static
 
 from planet import Planet, PlanetSize
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Status line for each (claimed, discovered) state
+_STATUS_LABELS = {
+    (True, True): "Status: ⚫ CLAIMED",
+    (True, False): "Status: ⚫ CLAIMED",
+    (False, True): "Status: ◉ DISCOVERED",
+    (False, False): "Status: ○ UNEXPLORED",
+}
+
+# Shared read-only resources shown for planets without a Planet object
+_EMPTY_RESOURCES = MappingProxyType({"food": 0, "gold": 0, "metal": 0})
+
+
+@functools.lru_cache(maxsize=32)
+def _format_label(key):
+    """Format a planet type or size key for display, e.g. gas_giant as Gas Giant"""
+    return key.replace("_", " ").title()
 
 
 class PlanetStatusWindow(Vertical):
@@ -17,42 +42,41 @@ class PlanetStatusWindow(Vertical):
     sector_coords = reactive("")
     world_coords = reactive("")
     resources = reactive({})
-    is_claimed = reactive(False)
-    is_discovered = reactive(False)
+    # (claimed, discovered), set together so the status line updates once
+    claim_status = reactive((False, False))
     
     def __init__(self):
         super().__init__()
         self.visible = False
         self.current_planet_data = None
         self._refresh_timer: Timer | None = None
+        # Text currently shown by each display line, to skip redundant updates
+        self._shown_text = {}
+        # Planet.resources_version of the resources currently shown
+        self._shown_resources_version = None
         
         # Create display widgets
         self.title_display = Static("▌ PLANET STATUS ▐", id="planet-status-title")
         self.name_display = Static("", id="planet-name")
-        self.type_display = Static("", id="planet-type")
-        self.size_display = Static("", id="planet-size")
-        self.coords_display = Static("", id="planet-coords")
-        self.sector_display = Static("", id="planet-sector")
-        self.resources_display = Static("", id="planet-resources")
+        # Type, size, coords, sector and resources share one style, so they are
+        # drawn as the lines of a single widget (five lines tall, see #planet-details)
+        self.details_display = Static("", id="planet-details")
+        self._detail_lines = dict.fromkeys(
+            ("type", "size", "coords", "sector", "resources"), ""
+        )
         self.status_display = Static("", id="planet-claim-status")
         self.divider = Static("━━━━━━━━━━━━━━━━━━━━━━━━━", id="planet-divider")
         
         # Style all components
-        for widget in [self.title_display, self.name_display, self.type_display, 
-                      self.size_display, self.coords_display, self.sector_display,
-                      self.resources_display, self.status_display, self.divider]:
-            widget.styles.height = 1
-            widget.styles.max_height = 1
+        for widget in [self.title_display, self.name_display,
+                      self.status_display, self.divider]:
+            widget.add_class("single-line")
     
     def compose(self) -> ComposeResult:
         yield self.title_display
         yield self.divider
         yield self.name_display
-        yield self.type_display
-        yield self.size_display
-        yield self.coords_display
-        yield self.sector_display
-        yield self.resources_display
+        yield self.details_display
         yield self.status_display
     
     def on_mount(self):
@@ -63,111 +87,119 @@ class PlanetStatusWindow(Vertical):
         self.watch_sector_coords(self.sector_coords)
         self.watch_world_coords(self.world_coords)
         self.watch_resources(self.resources)
-        self.watch_is_claimed(self.is_claimed)
-        self.watch_is_discovered(self.is_discovered)
+        self.watch_claim_status(self.claim_status)
         
         # Initially hidden
         self.hide_status()
     
+    def _set_text(self, display, text):
+        """Update a display line only when its text actually changes"""
+        if self._shown_text.get(display) != text:
+            self._shown_text[display] = text
+            display.update(text)
+
+    def _set_detail(self, line, text):
+        """Set one line of the details block"""
+        self._detail_lines[line] = text
+        self._set_text(self.details_display, "\n".join(self._detail_lines.values()))
+
     def watch_planet_name(self, value):
         if value:
-            self.name_display.update(f"Name: {value}")
+            self._set_text(self.name_display, f"Name: {value}")
         else:
-            self.name_display.update("")
+            self._set_text(self.name_display, "")
     
     def watch_planet_type(self, value):
         if value:
-            # Capitalize and format planet type
-            formatted_type = value.replace("_", " ").title()
-            self.type_display.update(f"Type: {formatted_type}")
+            self._set_detail("type", f"Type: {_format_label(value)}")
         else:
-            self.type_display.update("")
+            self._set_detail("type", "")
     
     def watch_planet_size(self, value):
         if value:
-            self.size_display.update(f"Size: {value.title()}")
+            self._set_detail("size", f"Size: {_format_label(value)}")
         else:
-            self.size_display.update("")
+            self._set_detail("size", "")
     
     def watch_sector_coords(self, value):
         if value:
-            self.sector_display.update(f"Sector: {value}")
+            self._set_detail("sector", f"Sector: {value}")
         else:
-            self.sector_display.update("")
+            self._set_detail("sector", "")
     
     def watch_world_coords(self, value):
         if value:
-            self.coords_display.update(f"Coords: {value}")
+            self._set_detail("coords", f"Coords: {value}")
         else:
-            self.coords_display.update("")
+            self._set_detail("coords", "")
     
     def watch_resources(self, value):
-        if value and isinstance(value, dict):
+        if value and isinstance(value, Mapping):
             if self.is_claimed:
                 # For claimed planets, show current available resources
                 food = value.get("food", 0)
                 gold = value.get("gold", 0)
                 metal = value.get("metal", 0)
-                self.resources_display.update(f"Available: F:{food} G:{gold} M:{metal}")
+                self._set_detail("resources", f"Available: F:{food} G:{gold} M:{metal}")
             else:
                 # For unclaimed planets, show question marks
-                self.resources_display.update(f"Resources: F:? G:? M:?")
+                self._set_detail("resources", f"Resources: F:? G:? M:?")
         else:
-            self.resources_display.update("")
+            self._set_detail("resources", "")
     
-    def watch_is_claimed(self, value):
+    @property
+    def is_claimed(self):
+        return self.claim_status[0]
+
+    @property
+    def is_discovered(self):
+        return self.claim_status[1]
+
+    def watch_claim_status(self, value):
         self._update_status_display()
         # Update resource display when claimed status changes
         self.watch_resources(self.resources)
     
-    def watch_is_discovered(self, value):
-        self._update_status_display()
-    
     def _update_status_display(self):
         """Update the status display based on claimed/discovered state"""
-        if self.is_claimed:
-            status = "Status: ⚫ CLAIMED"
-            style = "green"
-        elif self.is_discovered:
-            status = "Status: ◉ DISCOVERED"
-            style = "yellow"
-        else:
-            status = "Status: ○ UNEXPLORED"
-            style = "white"
-        
-        self.status_display.update(status)
+        self._set_text(self.status_display, _STATUS_LABELS[self.claim_status])
     
     def show_planet_info(self, planet_info, planet_data=None):
         """Display information for the selected planet"""
         # Store the planet data for periodic updates
         self.current_planet_data = planet_data
         
-        # Extract basic info from the game screen planet data
-        self.planet_name = planet_info.get("name", "Unknown Planet")
-        self.planet_type = planet_info.get("type", "unknown")
-        
-        # Format coordinates
-        px, py = planet_info.get("position", (0, 0))
-        self.world_coords = f"({px}, {py})"
-        
-        # Format sector
-        sector = planet_info.get("sector", (0, 0))
-        self.sector_coords = f"({sector[0]}, {sector[1]})"
-        
-        # If we have a Planet object with detailed data, use it
-        if planet_data and isinstance(planet_data, Planet):
-            self.planet_size = planet_data.size.value
-            self.resources = planet_data.available_resources
-            self.is_claimed = planet_data.claimed
-            self.is_discovered = planet_data.discovered
-        else:
-            # Use placeholder data for now - but we should still be able to show size
-            self.planet_size = "unknown"
-            self.resources = {"food": 0, "gold": 0, "metal": 0}  # Show 0 instead of "?"
-            self.is_claimed = False
-            self.is_discovered = True  # Assume discovered if we can see it
-        
-        self.show_status()
+        # Apply every field in one batch so the window repaints once
+        with self.app.batch_update():
+            # Extract basic info from the game screen planet data
+            self.planet_name = planet_info.get("name", "Unknown Planet")
+            self.planet_type = planet_info.get("type", "unknown")
+
+            # Format coordinates
+            px, py = planet_info.get("position", (0, 0))
+            self.world_coords = f"({px}, {py})"
+
+            # Format sector
+            sector = planet_info.get("sector", (0, 0))
+            self.sector_coords = f"({sector[0]}, {sector[1]})"
+
+            # If we have a Planet object with detailed data, use it
+            if planet_data and isinstance(planet_data, Planet):
+                self.planet_size = planet_data.size.value
+                self.resources = planet_data.available_resources.copy()
+                self._shown_resources_version = planet_data.resources_version
+                self.claim_status = (
+                    bool(planet_data.claimed),
+                    bool(planet_data.discovered),
+                )
+            else:
+                # Use placeholder data for now - but we should still be able to show size
+                self.planet_size = "unknown"
+                self.resources = _EMPTY_RESOURCES  # Show 0 instead of "?"
+                # Assume discovered if we can see it
+                self.claim_status = (False, True)
+
+            self.show_status()
         self._start_refresh_timer()
     
     def show_status(self):
@@ -177,18 +209,21 @@ class PlanetStatusWindow(Vertical):
     
     def hide_status(self):
         """Hide the status window"""
-        self.visible = False
-        self.styles.display = "none"
-        self._stop_refresh_timer()
-        # Clear all data
-        self.planet_name = ""
-        self.planet_type = ""
-        self.planet_size = ""
-        self.sector_coords = ""
-        self.world_coords = ""
-        self.resources = {}
-        self.is_claimed = False
-        self.is_discovered = False
+        # Already hidden and cleared, so there is nothing to reset
+        if not self.visible:
+            return
+        with self.app.batch_update():
+            self.visible = False
+            self.styles.display = "none"
+            self._stop_refresh_timer()
+            # Clear all data
+            self.planet_name = ""
+            self.planet_type = ""
+            self.planet_size = ""
+            self.sector_coords = ""
+            self.world_coords = ""
+            self.resources = {}
+            self.claim_status = (False, False)
         self.current_planet_data = None
 
     def _start_refresh_timer(self):
@@ -196,75 +231,78 @@ class PlanetStatusWindow(Vertical):
         # Stop any existing timer
         self._stop_refresh_timer()
         
-        # Start new timer if we have planet data and it's claimed
+        # Start new timer if we have planet data and it's claimed. The window
+        # keeps one interval for its lifetime and restarts it, rather than
+        # creating a new timer every time a planet is shown.
         if self.current_planet_data and self.is_claimed:
             # Reset the refresh time tracking
-            import time
             self._last_refresh_time = time.time()
-            self._refresh_timer = self.set_interval(2.0, self._refresh_planet_data)
+            if self._refresh_timer is None:
+                self._refresh_timer = self.set_interval(2.0, self._refresh_planet_data)
+            else:
+                self._refresh_timer.reset()
             # Debug: confirm timer started
-            from utils.logger import Logger
-            logger = Logger(__name__).get_logger()
             logger.info(f"Started refresh timer for claimed planet {self.planet_name}")
         else:
             # Debug: explain why timer didn't start
-            from utils.logger import Logger
-            logger = Logger(__name__).get_logger()
             claimed_status = "claimed" if self.is_claimed else "unclaimed"
             has_data = "has data" if self.current_planet_data else "no data"
             logger.info(f"Timer not started for planet {self.planet_name}: {claimed_status}, {has_data}")
 
     def _stop_refresh_timer(self):
-        """Stop the refresh timer"""
+        """Pause the refresh timer until another claimed planet is shown"""
         if self._refresh_timer:
-            self._refresh_timer.stop()
-            self._refresh_timer = None
+            self._refresh_timer.pause()
 
     def _refresh_planet_data(self):
         """Refresh the planet data from the Planet instance"""
-        from utils.logger import Logger
-        logger = Logger(__name__).get_logger()
-        
         if self.current_planet_data and isinstance(self.current_planet_data, Planet):
             # Simulate resource collection/depletion for claimed planets
             if self.current_planet_data.claimed:
                 # Calculate resources collected since last update (simulate what Docker container would do)
-                import time
                 current_time = time.time()
                 if not hasattr(self, '_last_refresh_time'):
                     self._last_refresh_time = current_time
                 
                 time_diff = current_time - self._last_refresh_time
-                logger.debug(f"Refreshing planet {self.planet_name} after {time_diff:.1f}s")
+                logger.debug(
+                    "Refreshing planet %s after %.1fs", self.planet_name, time_diff
+                )
                 
                 total_collected = 0
-                # Simulate resource collection (similar to planet.py logic)
-                for resource_type in ["food", "gold", "metal"]:
-                    if self.current_planet_data.available_resources.get(resource_type, 0) > 0:
-                        # Base collection rate (similar to planet.py)
-                        base_collection = self.current_planet_data.resource_collection_speed.get(resource_type, 1)
-                        # Match the balanced multiplier from planet.py
-                        upgrade_level = self.current_planet_data.upgrade_levels.get(resource_type, 0)
-                        upgrade_multiplier = 1 + (upgrade_level * 0.75)
-                        collection_amount = int(base_collection * upgrade_multiplier * time_diff)
-                        
+                planet = self.current_planet_data
+                available_resources = planet.available_resources
+                # Simulate resource collection with the same rates as planet.py
+                for resource_type, rate in planet.effective_rates.items():
+                    available = available_resources.get(resource_type, 0)
+                    if available > 0:
                         # Don't collect more than available
-                        actual_collection = min(collection_amount, self.current_planet_data.available_resources[resource_type])
-                        self.current_planet_data.available_resources[resource_type] -= actual_collection
+                        actual_collection = min(int(rate * time_diff), available)
+                        if actual_collection:
+                            available_resources[resource_type] = available - actual_collection
+                            planet.total_resources -= actual_collection
+                            planet.resources_version += 1
                         total_collected += actual_collection
                 
                 self._last_refresh_time = current_time
-                logger.debug(f"Planet {self.planet_name} resources: {self.current_planet_data.available_resources}, collected: {total_collected}")
-            
-            # Update UI with current resources
-            old_resources = self.resources.copy() if self.resources else {}
-            self.resources = self.current_planet_data.available_resources.copy()
+                logger.debug(
+                    "Planet %s resources: %s, collected: %s",
+                    self.planet_name,
+                    self.current_planet_data.available_resources,
+                    total_collected,
+                )
             
-            # Log if resources changed
-            if old_resources != self.resources:
-                logger.info(f"Planet {self.planet_name} resources updated: {self.resources}")
+            # Update UI with current resources, copying them only when they changed
+            if self.current_planet_data.resources_version != self._shown_resources_version:
+                self._shown_resources_version = self.current_planet_data.resources_version
+                self.resources = self.current_planet_data.available_resources.copy()
+                logger.info(
+                    "Planet %s resources updated: %s", self.planet_name, self.resources
+                )
             
             # Check if planet is depleted - if so, stop refreshing
-            if sum(self.current_planet_data.available_resources.values()) <= 0:
-                logger.info(f"Planet {self.planet_name} fully depleted - stopping refresh timer")
+            if self.current_planet_data.total_resources <= 0:
+                logger.info(
+                    "Planet %s fully depleted - stopping refresh timer", self.planet_name
+                )
                 self._stop_refresh_timer()
\ No newline at end of file
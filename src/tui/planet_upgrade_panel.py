@@ -12,10 +12,17 @@ class UpgradeButton(Button):
     def __init__(self, resource_type: str, cost: int, **kwargs):
         self.resource_type = resource_type
         self.cost = cost
-        super().__init__(f"Upgrade {resource_type.title()} ({cost}m)", **kwargs)
+        self._label_prefix = f"Upgrade {resource_type.title()} ("
+        super().__init__(f"{self._label_prefix}{cost}m)", **kwargs)
         self.styles.margin = (0, 1)
         self.styles.padding = (0, 1)
 
+    def set_cost(self, cost: int):
+        """Show a new upgrade cost, relabelling only when it changed"""
+        if cost != self.cost:
+            self.cost = cost
+            self.label = f"{self._label_prefix}{cost}m)"
+
 
 class PlanetUpgradePanel(Vertical):
     """Panel with interactive buttons for upgrading planet resource production"""
@@ -58,11 +65,11 @@ class PlanetUpgradePanel(Vertical):
         # Track which button is focused
         self.focused_button_index = 0
         self.buttons = [self.food_button, self.gold_button, self.metal_button]
+        self._focused_button = None  # Button currently carrying the "focused" class
         
         # Style components
         for widget in [self.title_display, self.divider1, self.divider2, self.instructions]:
-            widget.styles.height = 1
-            widget.styles.max_height = 1
+            widget.add_class("single-line")
     
     def compose(self) -> ComposeResult:
         yield self.title_display
@@ -93,39 +100,35 @@ class PlanetUpgradePanel(Vertical):
         self.update_button_focus()
     
     def watch_food_cost(self, value):
-        if hasattr(self, 'food_button'):
-            self.food_button.label = f"Upgrade Food ({value}m)"
-            self.food_button.cost = value
+        self.food_button.set_cost(value)
     
-    def watch_gold_cost(self, value):  
-        if hasattr(self, 'gold_button'):
-            self.gold_button.label = f"Upgrade Gold ({value}m)"
-            self.gold_button.cost = value
+    def watch_gold_cost(self, value):
+        self.gold_button.set_cost(value)
     
     def watch_metal_cost(self, value):
-        if hasattr(self, 'metal_button'):
-            self.metal_button.label = f"Upgrade Metal ({value}m)"
-            self.metal_button.cost = value
+        self.metal_button.set_cost(value)
     
     def show_panel(self, planet_info, planet_data=None, preserve_focus=True):
         """Show the upgrade panel for the selected planet"""
         self.planet_name = planet_info.get("name", "Unknown Planet")
         self.current_planet_data = planet_data
         
-        # Calculate upgrade costs dynamically based on current levels
-        if planet_data and hasattr(planet_data, 'calculate_upgrade_cost'):
-            self.food_cost = planet_data.calculate_upgrade_cost("food")
-            self.gold_cost = planet_data.calculate_upgrade_cost("gold") 
-            self.metal_cost = planet_data.calculate_upgrade_cost("metal")
-        else:
-            # Fallback to base costs if no planet data available
-            self.food_cost = 50
-            self.gold_cost = 50
-            self.metal_cost = 50
-        
-        self.visible = True
-        self.is_panel_visible = True
-        self.styles.display = "block"
+        # Calculate upgrade costs dynamically based on current levels, updating
+        # all three buttons in one batch
+        with self.app.batch_update():
+            if planet_data and hasattr(planet_data, 'calculate_upgrade_cost'):
+                self.food_cost = planet_data.calculate_upgrade_cost("food")
+                self.gold_cost = planet_data.calculate_upgrade_cost("gold")
+                self.metal_cost = planet_data.calculate_upgrade_cost("metal")
+            else:
+                # Fallback to base costs if no planet data available
+                self.food_cost = 50
+                self.gold_cost = 50
+                self.metal_cost = 50
+
+            self.visible = True
+            self.is_panel_visible = True
+            self.styles.display = "block"
         
         # Only reset focus if explicitly requested (e.g., first time opening panel)
         if not preserve_focus:
@@ -135,6 +138,9 @@ class PlanetUpgradePanel(Vertical):
     
     def hide_panel(self):
         """Hide the upgrade panel"""
+        # Already hidden and cleared, so there is nothing to reset
+        if not self.visible:
+            return
         self.visible = False
         self.is_panel_visible = False
         self.styles.display = "none"
@@ -145,9 +151,6 @@ class PlanetUpgradePanel(Vertical):
         if not self.visible:
             return
         
-        # Clear current focus
-        self.buttons[self.focused_button_index].remove_class("focused")
-        
         # Move to next/previous button
         self.focused_button_index = (self.focused_button_index + direction) % len(self.buttons)
         
@@ -159,12 +162,15 @@ class PlanetUpgradePanel(Vertical):
         if not self.visible:
             return
             
-        # Clear all focus states
-        for button in self.buttons:
-            button.remove_class("focused")
-        
-        # Set focus on current button
-        self.buttons[self.focused_button_index].add_class("focused")
+        # Move the focus class from the previously focused button only
+        button = self.buttons[self.focused_button_index]
+        if button is self._focused_button:
+            return
+        with self.app.batch_update():
+            if self._focused_button is not None:
+                self._focused_button.remove_class("focused")
+            button.add_class("focused")
+        self._focused_button = button
     
     def activate_focused_button(self):
         """Activate the currently focused upgrade button"""
@@ -200,6 +206,8 @@ class PlanetUpgradePanel(Vertical):
 
 class UpgradeRequested:
     """Custom message for when an upgrade is requested"""
+
+    __slots__ = ("upgrade_info",)
     
     def __init__(self, upgrade_info):
         self.upgrade_info = upgrade_info
\ No newline at end of file
@@ -1,48 +1,73 @@
 import asyncio
+import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import docker
-from utils.logger import Logger
+from utils.logger import get_logger
 
-logger = Logger(__name__).get_logger()
+logger = get_logger(__name__)
 
-# Initialize Docker client with error handling
-try:
-    client = docker.from_env()
-    # Test the connection
-    client.ping()
-    logger.info("Docker connection established successfully")
-except docker.errors.DockerException as e:
-    logger.error(f"Failed to connect to Docker daemon: {e}")
-    logger.error("Please make sure Docker is running and accessible")
-    client = None
-except Exception as e:
-    logger.error(f"Unexpected error connecting to Docker: {e}")
-    client = None
+CLEANUP_WORKERS = 8  # Planet containers stopped and removed in parallel
+STOP_TIMEOUT = 2  # Seconds a planet container gets to stop before it is killed
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Connect to the Docker daemon on first use, or return None if unavailable.
+
+    Importing this module does not talk to the daemon; the first function that
+    needs Docker pays for the connection and the result is reused.
+    """
+    try:
+        client = docker.from_env()
+        # Test the connection
+        client.ping()
+        logger.info("Docker connection established successfully")
+        return client
+    except docker.errors.DockerException as e:
+        logger.error(f"Failed to connect to Docker daemon: {e}")
+        logger.error("Please make sure Docker is running and accessible")
+    except Exception as e:
+        logger.error(f"Unexpected error connecting to Docker: {e}")
+    return None
 
 
 def remove_container(container_name):
+    """Stop and force-remove a container, returning whether it was removed"""
+    client = get_client()
     if client is None:
         logger.error(
             f"Cannot remove container '{container_name}': Docker client not available"
         )
-        return
+        return False
 
     try:
-        container = client.containers.get(container_name)
-        container.stop()
-        container.remove()
+        # The low-level API acts on the name directly, without inspecting first
+        try:
+            client.api.stop(container_name, timeout=STOP_TIMEOUT)
+        except docker.errors.NotFound:
+            raise
+        except docker.errors.APIError as e:
+            # e.g. the container is restarting; the forced remove still kills it
+            logger.warning(f"Could not stop container '{container_name}': {e}")
+        client.api.remove_container(container_name, force=True)
         logger.info(f"Stopped and removed container: {container_name}")
+        return True
     except docker.errors.NotFound:
         logger.error(f"No container found with name '{container_name}'")
     except docker.errors.APIError as e:
         logger.error(f"Error removing container '{container_name}': {e.explanation}")
+    except Exception as e:
+        logger.error(f"Failed to remove container '{container_name}': {e}")
+    return False
 
 
 def start_planet_container(
     planet_name, planet_uuid, nats_address="nats://localhost:4222"
 ):
     """Start a Docker container for a planet with the planet processor using the custom planet image"""
+    client = get_client()
     if client is None:
         logger.error(f"Cannot start planet container: Docker client not available")
         return None
@@ -75,8 +100,30 @@ def start_planet_container(
         return None
 
 
+def _container_names(filters):
+    """Names of all containers matching the filters, as listed by the daemon.
+
+    The low-level API returns plain summary dicts, skipping the Container
+    objects the high-level client builds for every result.
+    """
+    return [
+        summary["Names"][0].lstrip("/")
+        for summary in get_client().api.containers(all=True, filters=filters)
+    ]
+
+
+def _remove_containers(container_names):
+    """Stop and remove containers in parallel, returning how many were removed"""
+    if not container_names:
+        return 0
+    workers = min(CLEANUP_WORKERS, len(container_names))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(remove_container, container_names))
+
+
 def _cleanup_containers_sync():
     """Synchronous cleanup helper - runs in background thread"""
+    client = get_client()
     if client is None:
         logger.error("Cannot cleanup planet containers: Docker client not available")
         return
@@ -84,17 +131,7 @@ def _cleanup_containers_sync():
     try:
         logger.info(f"Starting container clean up process...")
         # Get all containers with names starting with "planet-"
-        containers = client.containers.list(all=True, filters={"name": "planet-"})
-
-        removed_count = 0
-        for container in containers:
-            try:
-                logger.info(f"Removing planet container: {container.name}")
-                container.stop()
-                container.remove()
-                removed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to remove container {container.name}: {e}")
+        removed_count = _remove_containers(_container_names({"name": "planet-"}))
 
         if removed_count > 0:
             logger.info(f"Successfully removed {removed_count} planet containers")
@@ -107,30 +144,25 @@ def _cleanup_containers_sync():
 
 def cleanup_non_home_planet_containers():
     """Remove all planet containers except home-planet for game reset"""
+    client = get_client()
     if client is None:
         logger.error("Cannot cleanup planet containers: Docker client not available")
         return
 
     try:
         logger.info("Starting cleanup of non-home planet containers...")
-        # Get all planet containers (both "planet-{uuid}" and "dockernauts-planet-home")
-        all_containers = client.containers.list(all=True)
-        containers = [c for c in all_containers if "planet" in c.name]
-
-        removed_count = 0
-        for container in containers:
-            # Skip the home-planet container (dockernauts-planet-home)
-            if container.name == "dockernauts-planet-home":
-                logger.info(f"Skipping home planet container: {container.name}")
-                continue
-                
-            try:
-                logger.info(f"Removing planet container: {container.name}")
-                container.stop()
-                container.remove()
-                removed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to remove container {container.name}: {e}")
+        # Get all planet containers (both "planet-{uuid}" and
+        # "dockernauts-planet-home"), letting the daemon do the name matching
+        container_names = _container_names({"name": "planet"})
+
+        # Skip the home-planet container (dockernauts-planet-home)
+        to_remove = []
+        for container_name in container_names:
+            if container_name == "dockernauts-planet-home":
+                logger.info(f"Skipping home planet container: {container_name}")
+            else:
+                to_remove.append(container_name)
+        removed_count = _remove_containers(to_remove)
 
         if removed_count > 0:
             logger.info(f"Successfully removed {removed_count} non-home planet containers")
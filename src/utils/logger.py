@@ -1,3 +1,4 @@
+import functools
 import logging
 
 
@@ -17,3 +18,9 @@ class Logger:
 
     def get_logger(self) -> logging.Logger:
         return self.logger
+
+
+@functools.lru_cache(maxsize=None)
+def get_logger(name=__name__, level=logging.DEBUG) -> logging.Logger:
+    """Get a configured logger, setting it up only the first time a name is used"""
+    return Logger(name, level).get_logger()
@@ -7,7 +7,16 @@ from nats.aio.msg import Msg
 from nats.js.api import StreamConfig
 from nats.js.errors import NotFoundError
 
-from utils.logger import Logger
+from utils.logger import get_logger
+
+# One compact encoder shared by every publish, so messages skip json.dumps'
+# per-call argument handling and carry no padding whitespace
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def encode_json(data) -> bytes:
+    """Encode a message payload as compact UTF-8 JSON"""
+    return _json_encoder.encode(data).encode()
 
 
 class NatsClient:
@@ -18,7 +27,7 @@ class NatsClient:
         self.retry_delay = retry_delay
         self.nc = NATS()
         self.js = None
-        self.logger = Logger(__name__).get_logger()
+        self.logger = get_logger(__name__)
 
     async def connect(self):
         try:
@@ -37,26 +46,41 @@ class NatsClient:
         except ErrNoServers as e:
             self.logger.error(f"Could not connect to NATS server: {e}")
 
+    def jetstream(self):
+        """Get the JetStream context, created once and reused for every publish"""
+        if self.js is None:
+            self.js = self.nc.jetstream()
+        return self.js
+
     async def publish_js_json(self, data: dict):
         if not self.js:
             self.logger.error("Cannot publish: not connected to JetStream.")
             return
         try:
-            message = json.dumps(data)
-            ack = await self.js.publish(self.subject, message.encode())
+            ack = await self.js.publish(self.subject, encode_json(data))
             self.logger.debug(
-                f"Published to '{self.subject}', seq={ack.seq}, stream={ack.stream}"
+                "Published to '%s', seq=%s, stream=%s", self.subject, ack.seq, ack.stream
             )
         except Exception as e:
             self.logger.exception(f"Failed to publish message: {e}")
 
+    async def publish_json(self, data: dict):
+        if not self.nc.is_connected:
+            self.logger.error("Cannot publish: not connected to NATs.")
+            return
+        try:
+            await self.nc.publish(self.subject, encode_json(data))
+            self.logger.debug("Published to '%s'", self.subject)
+        except Exception as e:
+            self.logger.exception(f"Failed to publish message: {e}")
+
     async def publish_reply_json(self, data: dict, msg: Msg):
         if not self.nc:
             self.logger.error("Cannot publish: not connected to NATs.")
             return
         try:
-            ack = await self.nc.publish(msg.reply, json.dumps(data).encode())
-            self.logger.debug(f"Published to '{self.subject}'")
+            ack = await self.nc.publish(msg.reply, encode_json(data))
+            self.logger.debug("Published to '%s'", self.subject)
         except Exception as e:
             self.logger.exception(f"Failed to publish message: {e}")
 
@@ -67,7 +91,7 @@ class NatsClient:
 
         try:
             await self.js.subscribe(self.subject, cb=callback)
-            self.logger.debug(f"Subscribed to '{self.subject}'")
+            self.logger.debug("Subscribed to '%s'", self.subject)
         except Exception as e:
             self.logger.exception(f"Failed to subscribe: {e}")
 
@@ -79,7 +103,7 @@ class NatsClient:
             return
         try:
             await self.nc.subscribe(self.subject, cb=callback)
-            self.logger.debug(f"Subscribed to subject '{self.subject}'")
+            self.logger.debug("Subscribed to subject '%s'", self.subject)
         except Exception as e:
             self.logger.exception(f"Failed to subscribe: {e}")
 
@@ -87,22 +111,33 @@ class NatsClient:
         if not self.nc.is_connected:
             await self.nc.connect(servers=[self.servers])
 
-        js = self.nc.jetstream()
-
-        for stream in streams:
-            try:
-                await js.stream_info(stream)
-                self.logger.debug(f"NATS stream '{stream}' already exists")
-            except NotFoundError:
-                config = StreamConfig(
-                    name=stream,
-                    subjects=[f"{stream}.>"],
-                )
-                try:
-                    await js.add_stream(config)
-                    self.logger.debug(f"Added NATS stream: '{stream}'")
-                except Exception as e:
-                    self.logger.error(f"Failed to add stream '{stream}': {e}")
+        js = self.jetstream()
+
+        # Look up every stream at once, then add the missing ones together
+        infos = await asyncio.gather(
+            *(js.stream_info(stream) for stream in streams), return_exceptions=True
+        )
+        missing = []
+        for stream, info in zip(streams, infos):
+            if isinstance(info, NotFoundError):
+                missing.append(stream)
+            elif isinstance(info, Exception):
+                raise info
+            else:
+                self.logger.debug("NATS stream '%s' already exists", stream)
+
+        results = await asyncio.gather(
+            *(
+                js.add_stream(StreamConfig(name=stream, subjects=[f"{stream}.>"]))
+                for stream in missing
+            ),
+            return_exceptions=True,
+        )
+        for stream, result in zip(missing, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to add stream '{stream}': {result}")
+            else:
+                self.logger.debug("Added NATS stream: '%s'", stream)
 
     async def on_disconnect(self, nc):
         self.logger.warning("Disconnected from NATS.")
@@ -1,39 +1,222 @@
 import argparse
 import asyncio
-import json
+import hashlib
+import os
+import sys
+from contextlib import asynccontextmanager
 
-from nats.aio.client import Client as NATS
+DEFAULT_NATS_URL = "nats://localhost:4222"
+DEFAULT_SUBJECT = "MASTER.resources"
+
+# Grants always carry the same three integer fields, so the JSON is formatted directly
+RESOURCES_PAYLOAD = b'{"food":%d,"metal":%d,"gold":%d}'
+
+# Unix socket a --daemon publisher listens on for "<subject> <payload>" lines; it
+# answers each with "ok <seq> <stream>" or "error <reason>"
+DAEMON_SOCKET = "/tmp/dockernauts-pub-{}.sock"
+
+
+def daemon_socket(nats_url):
+    """Socket of the daemon connected to nats_url, so grants only reach that server"""
+    return DAEMON_SOCKET.format(hashlib.sha1(nats_url.encode()).hexdigest()[:12])
+
+
+class JsPublisher:
+    """JetStream publisher holding one connection open across many publishes"""
+
+    def __init__(self, nats_url):
+        # Imported here so --help, bad arguments and daemon forwarding skip loading it
+        from nats.aio.client import Client as NATS
+
+        self.nats_url = nats_url
+        self._nc = NATS()
+        self._js = None
+
+    async def connect(self):
+        await self._nc.connect(
+            servers=[self.nats_url],
+            allow_reconnect=True,
+            max_reconnect_attempts=5,
+            reconnect_time_wait=2,
+        )
+        self._js = self._nc.jetstream()
+
+    async def publish(self, subject, payload):
+        return await self._js.publish(subject, payload)
+
+    async def send(self, subject, payload):
+        """Core NATS publish that is stored by the subject's stream without an ack"""
+        stream = subject.partition(".")[0]
+        await self._nc.publish(
+            subject, payload, headers={"Nats-Expected-Stream": stream}
+        )
+
+    async def close(self):
+        # Nothing is subscribed, so a flush is all drain() would need to do
+        try:
+            await self._nc.flush(timeout=1)
+        finally:
+            await self._nc.close()
+
+
+@asynccontextmanager
+async def publisher(nats_url):
+    """Connected JsPublisher that is flushed and closed on exit"""
+    js_publisher = JsPublisher(nats_url)
+    await js_publisher.connect()
+    try:
+        yield js_publisher
+    finally:
+        await js_publisher.close()
+
+
+async def serve(js):
+    """Publish each line sent to the daemon socket, answering with its ack"""
+    socket_path = daemon_socket(js.nats_url)
+
+    async def reply(writer, pending):
+        # Lines are published as they arrive; acks are written back in line order
+        while (publish := await pending.get()) is not None:
+            try:
+                ack = await publish
+            except Exception as e:
+                line = f"error {type(e).__name__}: {e}"
+            else:
+                line = f"ok {ack.seq} {ack.stream}"
+            writer.write(line.replace("\n", " ").encode() + b"\n")
+
+    async def handle(reader, writer):
+        pending = asyncio.Queue()
+        replier = asyncio.create_task(reply(writer, pending))
+        try:
+            async for line in reader:
+                subject, _, payload = line.rstrip(b"\n").partition(b" ")
+                pending.put_nowait(
+                    asyncio.create_task(js.publish(subject.decode(), payload))
+                )
+        finally:
+            pending.put_nowait(None)
+            try:
+                await replier
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    print(f"📡 Publishing lines sent to {socket_path} on {js.nats_url}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        os.unlink(socket_path)
+
+
+async def forward(nats_url, subject, payload, count):
+    """Hand the publishes to a daemon on nats_url, or return None if there isn't one"""
+    try:
+        reader, writer = await asyncio.open_unix_connection(daemon_socket(nats_url))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    writer.write((subject.encode() + b" " + payload + b"\n") * count)
+    writer.write_eof()
+    acks = []
+    async for line in reader:
+        status, _, detail = line.decode().rstrip("\n").partition(" ")
+        if status == "ok":
+            acks.append(detail.split())
+        else:
+            print(f"❌ Daemon failed to publish to '{subject}': {detail}")
+    writer.close()
+    await writer.wait_closed()
+    return acks
 
 
 async def main():
     parser = argparse.ArgumentParser(description="JetStream Publisher")
-    parser.add_argument("--food", default="0", help="Food to give to the player")
-    parser.add_argument("--metal", default="0", help="Metal to give to the player")
-    parser.add_argument("--gold", default="0", help="Gold to give to the player")
     parser.add_argument(
-        "--nats-url", default="nats://localhost:4222", help="NATS server URL"
+        "--food", type=int, default=0, help="Food to give to the player"
+    )
+    parser.add_argument(
+        "--metal", type=int, default=0, help="Metal to give to the player"
+    )
+    parser.add_argument(
+        "--gold", type=int, default=0, help="Gold to give to the player"
+    )
+    parser.add_argument(
+        "--nats-url", default=DEFAULT_NATS_URL, help="NATS server URL"
+    )
+    parser.add_argument("--subject", default=DEFAULT_SUBJECT, help="NATS subject")
+    parser.add_argument(
+        "--count", type=int, default=1, help="Number of times to give the resources"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Number of grants packed into each message as a JSON array",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Wait for each publish to be acknowledged before sending the next",
+    )
+    parser.add_argument(
+        "--no-ack",
+        "--no-jetstream",
+        dest="no_ack",
+        action="store_true",
+        help="Publish with core NATS, skipping the JetStream ack for each message",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay connected to --nats-url and publish lines sent to a local socket",
     )
-    parser.add_argument("--subject", default="MASTER.resources", help="NATS subject")
     args = parser.parse_args()
 
-    nc = NATS()
-    await nc.connect(servers=[args.nats_url])
-    js = nc.jetstream()
+    if args.daemon:
+        async with publisher(args.nats_url) as js:
+            await serve(js)
+        return
 
-    resources = {
-        "food": int(args.food),
-        "metal": int(args.metal),
-        "gold": int(args.gold),
-    }
-
-    payload = json.dumps(resources).encode()
-    ack = await js.publish(args.subject, payload)
-    print(
-        f"✅ Published to '{args.subject}' with sequence {ack.seq} in stream '{ack.stream}'"
-    )
+    payload = RESOURCES_PAYLOAD % (args.food, args.metal, args.gold)
+    if args.batch > 1:
+        payload = b"[" + b",".join([payload] * args.batch) + b"]"
+    subject, count = args.subject, args.count
+    if args.no_ack:
+        # The stream still captures the subject; only the ack round trip is skipped
+        async with publisher(args.nats_url) as js:
+            for _ in range(count):
+                await js.send(subject, payload)
+        print(f"📨 Sent {count} message(s) to '{subject}' without acks")
+        return
 
-    await nc.drain()
+    # A daemon publishes concurrently, so it cannot stand in for --sync
+    acks = None
+    if not args.sync:
+        acks = await forward(args.nats_url, subject, payload, count)
+    if acks is None:
+        async with publisher(args.nats_url) as js:
+            if args.sync:
+                acks = [await js.publish(subject, payload) for _ in range(count)]
+            else:
+                # Send every message up front and wait for all the acks together
+                acks = await asyncio.gather(
+                    *(js.publish(subject, payload) for _ in range(count))
+                )
+        acks = [(ack.seq, ack.stream) for ack in acks]
+    for seq, stream in acks:
+        print(f"✅ Published to '{subject}' with sequence {seq} in stream '{stream}'")
+    if len(acks) != count:
+        print(f"❌ Only {len(acks)} of {count} message(s) were acknowledged")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop is optional; the stock event loop works, just with slower socket I/O
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())